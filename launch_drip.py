@@ -9,6 +9,7 @@ import sys
 import os
 import logging
 import traceback
+from importlib.util import find_spec
 
 # Add current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -36,10 +37,9 @@ def check_dependencies():
     required_packages = ['PyQt5', 'pystray', 'pynput']
     missing_packages = []
     
+    # find_spec locates the package without executing it; the real import happens in main()
     for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
+        if find_spec(package) is None:
             missing_packages.append(package)
     
     if missing_packages:
@@ -60,7 +60,12 @@ def main():
             return 1
         
         # Import and run the main application
-        from main import DripApp
+        from main import DripApp, notify_running_instance
+        
+        # A second launch only hands over to the running instance
+        if notify_running_instance():
+            logger.info("Drip is already running - opened its create flashcard window")
+            return 0
         
         logger.info("Starting Drip - Vocabulary Learning System")
         app = DripApp()
@@ -1,27 +1,97 @@
+import base64
 import sys
-import threading
 from typing import Optional
 from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction, QMessageBox
-from PyQt5.QtCore import QTimer, pyqtSignal, QObject
-from PyQt5.QtGui import QIcon, QPixmap, QPainter, QColor, QFont
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject, QRunnable, QThreadPool
+from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
 from pynput import keyboard
 import logging
 
 from src.database.database_manager import DatabaseManager
-from src.ui.create_new_flashcard import CreateNewFlashcard
 from src.core.reviewer_schedule_maker import ReviewerScheduleMaker
-from src.ui.settings_window import SettingsWindow
-from src.utils.sound_manager import get_sound_manager
 from src.utils.auto_insert_new_word import AutoInsertNewWord
-from src.ui.notification_modal import show_vocabulary_added_notification
+from src.utils.native_hotkeys import NativeHotkeyFilter, MOD_CONTROL, MOD_SHIFT, VK_SPACE
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 32x32 water drop tray icon (blue circle + triangle tail), pre-rendered PNG
+_DROP_ICON_PNG_B64 = (
+    b"iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA9hAAAPYQGoP6dpAAAA"
+    b"mUlEQVRYhe3WwRWAIAwD0OoubuBQjuRQbOAwevcJLUl8cGjuwm8BwSxDZj+vm/l+HTk5DVBAYICi"
+    b"egrwDgqCAKrqYUAtCKwboKweAnjpBS5/DV6OLTR2GIC0PoIIAZh19xAuQLHpWogmQLnjawj5KehN"
+    b"tQPq82723YXhHUhAAoYD8kc0912gQNC3IYOQvQcQhPxFFIVEJ54mD8wPSAN1Lho/AAAAAElFTkSu"
+    b"QmCC"
+)
+
+# Local socket name used to detect an already running instance
+INSTANCE_SERVER_NAME = "drip-vocab"
+
+def notify_running_instance() -> bool:
+    """Ask an already running Drip to open the create window; True if one answered"""
+    socket = QLocalSocket()
+    socket.connectToServer(INSTANCE_SERVER_NAME)
+    if not socket.waitForConnected(100):
+        return False
+    
+    socket.write(b"raise")
+    socket.waitForBytesWritten(100)
+    socket.disconnectFromServer()
+    return True
+
+# pynput fallback: bit for each hotkey key (1 = Ctrl, 2 = Shift, 4 = Space, 8 = R)
+_SPECIAL_KEY_BITS = {
+    keyboard.Key.ctrl_l: 1, keyboard.Key.ctrl_r: 1,
+    keyboard.Key.shift_l: 2, keyboard.Key.shift_r: 2,
+    keyboard.Key.space: 4,
+}
+
+def _hotkey_bit(key):
+    """Map a pynput key to its hotkey bit (0 for keys that are not part of a hotkey)"""
+    # Special keys are enum members (cheap hash); KeyCode hashes via repr(), so check char directly
+    if isinstance(key, keyboard.Key):
+        return _SPECIAL_KEY_BITS.get(key, 0)
+    char = getattr(key, 'char', None)
+    if char and char.lower() == 'r':
+        return 8
+    return 0
+
+class _StartupReviewCheckTask(QRunnable):
+    """Count due flashcards on a pool thread and report back through a signal (-1 on error)"""
+    
+    def __init__(self, database_manager, done_signal):
+        super().__init__()
+        self.database_manager = database_manager
+        self.done_signal = done_signal
+    
+    def run(self):
+        try:
+            due_count = len(self.database_manager.get_due_flashcards(limit=1))
+        except Exception:
+            logger.exception("Error checking startup reviews")
+            due_count = -1
+        self.done_signal.emit(due_count)
+
 class DripApp(QObject):
     # Signals for thread-safe operations
     show_create_signal = pyqtSignal()
     start_review_signal = pyqtSignal()
+    startup_reviews_checked = pyqtSignal(int)
+    
+    # Tray icon decoded once and shared (needs a QApplication, so built lazily)
+    _TRAY_ICON = None
+    
+    # Tray menu entries: (label, slot name), None for a separator
+    _TRAY_MENU = (
+        ("💧 Create Flashcard", "show_create_flashcard"),
+        ("📚 Start Review", "start_manual_review"),
+        None,
+        ("⚙️ Settings", "show_settings"),
+        ("📊 Statistics", "show_statistics"),
+        None,
+        ("❌ Quit", "quit_application"),
+    )
     
     def __init__(self):
         super().__init__()
@@ -39,7 +109,6 @@ class DripApp(QObject):
         self.reviewer_schedule_maker = ReviewerScheduleMaker(self.database_manager)
         self.create_flashcard_window = None
         self.settings_window = None
-        self.sound_manager = get_sound_manager()
         self.auto_insert_manager = AutoInsertNewWord()
         
         # System tray
@@ -49,20 +118,34 @@ class DripApp(QObject):
         self.review_timer = QTimer()
         self.review_timer.timeout.connect(self.start_automatic_review)
         
+        # One-shot timers reused for retry (review in progress) and the delayed startup review
+        self.review_retry_timer = QTimer()
+        self.review_retry_timer.setSingleShot(True)
+        self.review_retry_timer.timeout.connect(self.start_automatic_review)
+        
+        self.startup_review_timer = QTimer()
+        self.startup_review_timer.setSingleShot(True)
+        self.startup_review_timer.timeout.connect(self.start_automatic_review)
+        
         # Timer for auto-insert check (precise timing)
         self.auto_insert_timer = QTimer()
         self.auto_insert_timer.timeout.connect(self.check_auto_insert_words)
         self.auto_insert_timer.setSingleShot(True)  # Single shot timer for precise timing
         
+        # Listen for later launches so they can hand over to this instance
+        self.setup_instance_server()
+        
         # Initialize system tray
         self.setup_system_tray()
         
         # Initialize hotkeys
         self.setup_hotkeys()
         
-        # Connect signals
-        self.show_create_signal.connect(self.show_create_flashcard)
-        self.start_review_signal.connect(self.start_manual_review)
+        # Connect signals - only emitted from the pynput listener thread, so always queue
+        # to the GUI thread (native hotkeys call the slots directly)
+        self.show_create_signal.connect(self.show_create_flashcard, Qt.QueuedConnection)
+        self.start_review_signal.connect(self.start_manual_review, Qt.QueuedConnection)
+        self.startup_reviews_checked.connect(self.on_startup_reviews_checked, Qt.QueuedConnection)
         
         # Check auto-insert daily words and setup timer
         self.check_auto_insert_words()
@@ -81,70 +164,41 @@ class DripApp(QObject):
         
         logger.info("Drip application initialized successfully")
     
+    def setup_instance_server(self):
+        """Accept connections from later launches (see notify_running_instance)"""
+        # Remove a stale socket left by a crashed instance - none is running if we got here
+        QLocalServer.removeServer(INSTANCE_SERVER_NAME)
+        self.instance_server = QLocalServer(self)
+        self.instance_server.newConnection.connect(self.on_instance_connection)
+        if not self.instance_server.listen(INSTANCE_SERVER_NAME):
+            logger.warning("Single-instance server unavailable: %s", self.instance_server.errorString())
+    
+    def on_instance_connection(self):
+        """Another launch was started - bring up the create flashcard window instead"""
+        socket = self.instance_server.nextPendingConnection()
+        if socket:
+            socket.disconnected.connect(socket.deleteLater)
+        logger.info("Drip launched again - opening create flashcard window")
+        self.show_create_flashcard()
+    
     def setup_system_tray(self):
         """Setup system tray icon and menu using Qt (like flashcard_app.py)"""
         # Create system tray icon
         self.tray_icon = QSystemTrayIcon(self.app)
         
-        # Create a simple water drop icon (similar to flashcard_app.py)
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(QColor(0, 0, 0, 0))  # Transparent background
-        painter = QPainter(pixmap)
-        
-        # Draw water drop
-        painter.setBrush(QColor(52, 152, 219))  # Blue color
-        painter.setPen(QColor(52, 152, 219))
-        
-        # Main drop (circle)
-        painter.drawEllipse(6, 10, 20, 20)
-        
-        # Drop tail (triangle points)
-        from PyQt5.QtGui import QPolygon
-        from PyQt5.QtCore import QPoint
-        triangle = QPolygon([
-            QPoint(16, 2),   # Top point
-            QPoint(11, 12),  # Bottom left
-            QPoint(21, 12)   # Bottom right
-        ])
-        painter.drawPolygon(triangle)
-        painter.end()
-        
-        self.tray_icon.setIcon(QIcon(pixmap))
+        self.tray_icon.setIcon(self.get_tray_icon())
         self.tray_icon.setToolTip("Drip - Vocabulary Learning\nCtrl+Space: Create flashcard\nCtrl+Shift+R: Review")
         
-        # Create tray menu
+        # Create tray menu from the (label, slot name) table; None is a separator
         tray_menu = QMenu()
-        
-        # Create flashcard action
-        create_action = QAction("💧 Create Flashcard", self.app)
-        create_action.triggered.connect(self.show_create_flashcard)
-        tray_menu.addAction(create_action)
-        
-        # Start review action
-        review_action = QAction("📚 Start Review", self.app)
-        review_action.triggered.connect(self.start_manual_review)
-        tray_menu.addAction(review_action)
-        
-        # Separator
-        tray_menu.addSeparator()
-        
-        # Settings action
-        settings_action = QAction("⚙️ Settings", self.app)
-        settings_action.triggered.connect(self.show_settings)
-        tray_menu.addAction(settings_action)
-        
-        # Statistics action
-        stats_action = QAction("📊 Statistics", self.app)
-        stats_action.triggered.connect(self.show_statistics)
-        tray_menu.addAction(stats_action)
-        
-        # Separator
-        tray_menu.addSeparator()
-        
-        # Quit action
-        quit_action = QAction("❌ Quit", self.app)
-        quit_action.triggered.connect(self.quit_application)
-        tray_menu.addAction(quit_action)
+        for item in self._TRAY_MENU:
+            if item is None:
+                tray_menu.addSeparator()
+                continue
+            label, slot_name = item
+            action = QAction(label, self.app)
+            action.triggered.connect(getattr(self, slot_name))
+            tray_menu.addAction(action)
         
         self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.activated.connect(self.tray_icon_activated)
@@ -152,74 +206,91 @@ class DripApp(QObject):
         
         logger.info("System tray icon created successfully")
     
+    @classmethod
+    def get_tray_icon(cls):
+        """Water drop tray icon, decoded from the embedded PNG on first use"""
+        if cls._TRAY_ICON is None:
+            pixmap = QPixmap()
+            pixmap.loadFromData(base64.b64decode(_DROP_ICON_PNG_B64), "PNG")
+            cls._TRAY_ICON = QIcon(pixmap)
+        return cls._TRAY_ICON
+    
     def setup_hotkeys(self):
-        """Setup global hotkey using pynput with key state tracking (like Create_flashcard.py)"""
-        self.pressed_keys = set()
-        
-        def on_press(key):
-            try:
-                # Add key to pressed set
-                self.pressed_keys.add(key)
-                
-                # Check for Ctrl+Space combination
-                ctrl_pressed = any(k in self.pressed_keys for k in [keyboard.Key.ctrl_l, keyboard.Key.ctrl_r])
-                space_pressed = keyboard.Key.space in self.pressed_keys
-                
-                if ctrl_pressed and space_pressed:
-                    logger.info("Ctrl+Space detected - Opening create flashcard")
-                    # Emit signal to show window (thread-safe)
-                    self.show_create_signal.emit()
-                    # Clear pressed keys to prevent repeated triggers
-                    self.pressed_keys.clear()
-                    return
-                
-                # Check for Ctrl+Shift+R combination
-                shift_pressed = any(k in self.pressed_keys for k in [keyboard.Key.shift_l, keyboard.Key.shift_r])
-                r_pressed = any(hasattr(k, 'char') and k.char and k.char.lower() == 'r' for k in self.pressed_keys)
-                
-                if ctrl_pressed and shift_pressed and r_pressed:
-                    logger.info("Ctrl+Shift+R detected - Starting manual review")
-                    # Emit signal to start review (thread-safe)
-                    self.start_review_signal.emit()
-                    # Clear pressed keys to prevent repeated triggers
-                    self.pressed_keys.clear()
-                    return
-                    
-            except AttributeError:
-                # Handle special keys that don't have char
-                pass
-        
-        def on_release(key):
-            try:
-                # Remove key from pressed set
-                self.pressed_keys.discard(key)
-            except AttributeError:
-                pass
-        
-        # Start keyboard listener in separate thread
-        def start_listener():
-            with keyboard.Listener(
-                on_press=on_press,
-                on_release=on_release,
-                suppress=False
-            ) as listener:
-                listener.join()
-        
-        # Start listener thread
-        listener_thread = threading.Thread(target=start_listener, daemon=True)
-        listener_thread.start()
+        """Setup global hotkeys - native OS registration when available, pynput otherwise"""
+        self.hotkey_listener = None
+        if self.setup_native_hotkeys():
+            logger.info("Hotkeys registered with the OS")
+        else:
+            self.setup_pynput_hotkeys()
         
         logger.info("Hotkeys initialized successfully!")
         logger.info("Available hotkeys:")
         logger.info("  Ctrl+Space: Create new flashcard")
         logger.info("  Ctrl+Shift+R: Start manual review")
     
+    def setup_native_hotkeys(self):
+        """Register hotkeys with the OS; the filter calls our slots directly on the GUI thread"""
+        self.native_hotkeys = None
+        if not NativeHotkeyFilter.is_supported():
+            return False
+        
+        native_hotkeys = NativeHotkeyFilter()
+        if not (native_hotkeys.register(1, MOD_CONTROL, VK_SPACE, self.show_create_flashcard) and
+                native_hotkeys.register(2, MOD_CONTROL | MOD_SHIFT, ord('R'), self.start_manual_review)):
+            # Combination taken by another program (e.g. IME on Ctrl+Space) - fall back to pynput
+            native_hotkeys.unregister_all()
+            return False
+        
+        self.app.installNativeEventFilter(native_hotkeys)
+        self.native_hotkeys = native_hotkeys
+        return True
+    
+    def setup_pynput_hotkeys(self):
+        """Setup global hotkey using pynput with key state tracking (like Create_flashcard.py)
+        
+        Held keys are tracked as a bitmask: 1 = Ctrl, 2 = Shift, 4 = Space, 8 = R
+        """
+        self.hotkey_mask = 0
+        
+        def on_press(key):
+            self.hotkey_mask |= _hotkey_bit(key)
+            
+            # Check for Ctrl+Space combination
+            if self.hotkey_mask & 5 == 5:
+                logger.info("Ctrl+Space detected - Opening create flashcard")
+                # Emit signal to show window (thread-safe)
+                self.show_create_signal.emit()
+                # Clear pressed keys to prevent repeated triggers
+                self.hotkey_mask = 0
+                return
+            
+            # Check for Ctrl+Shift+R combination
+            if self.hotkey_mask & 11 == 11:
+                logger.info("Ctrl+Shift+R detected - Starting manual review")
+                # Emit signal to start review (thread-safe)
+                self.start_review_signal.emit()
+                # Clear pressed keys to prevent repeated triggers
+                self.hotkey_mask = 0
+        
+        def on_release(key):
+            self.hotkey_mask &= ~_hotkey_bit(key)
+        
+        # The pynput listener is itself a daemon thread - start it directly
+        self.hotkey_listener = keyboard.Listener(
+            on_press=on_press,
+            on_release=on_release,
+            suppress=False
+        )
+        self.hotkey_listener.start()
+    
     def show_create_flashcard(self):
         """Show the flashcard creator window (like flashcard_app.py)"""
         try:
             logger.info("Opening create flashcard window...")
             
             if self.create_flashcard_window is None:
+                # Imported on first use to keep the window's widgets out of cold start
+                from src.ui.create_new_flashcard import CreateNewFlashcard
                 self.create_flashcard_window = CreateNewFlashcard(self.database_manager)
                 self.create_flashcard_window.closed.connect(self.on_create_flashcard_closed)
             
@@ -229,14 +300,16 @@ class DripApp(QObject):
             
             logger.info("Create flashcard window opened successfully")
             
-        except Exception as e:
-            logger.error(f"Failed to show create flashcard window: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Failed to show create flashcard window")
     
     def on_create_flashcard_closed(self):
-        """Handle CreateNewFlashcard window closed"""
-        self.create_flashcard_window = None
+        """Handle CreateNewFlashcard window closed
+        
+        The window is kept and reset rather than rebuilt (widgets, layout and stylesheet
+        polish) on every Ctrl+Space.
+        """
+        self.create_flashcard_window.reset_form()
     
     def tray_icon_activated(self, reason):
         """Handle tray icon activation"""
@@ -250,13 +323,13 @@ class DripApp(QObject):
             
             if success:
                 logger.info("Manual review session completed successfully")
-                # Reschedule next automatic review
-                self.schedule_next_review()
+                # Reschedule next automatic review (interval already computed by the session)
+                self.schedule_next_review(next_interval)
             else:
                 logger.info("No flashcards due for review")
                 
-        except Exception as e:
-            logger.error(f"Failed to start manual review: {e}")
+        except Exception:
+            logger.exception("Failed to start manual review")
     
     def start_automatic_review(self):
         """Start automatic review session (called by timer)"""
@@ -265,7 +338,7 @@ class DripApp(QObject):
             if self.reviewer_schedule_maker.is_review_in_progress():
                 logger.info("Review already in progress, skipping automatic review")
                 # Retry after 30 seconds
-                self.review_timer.singleShot(30000, self.start_automatic_review)
+                self.review_retry_timer.start(30000)
                 return
             
             success, next_interval = self.reviewer_schedule_maker.start_review_session()
@@ -273,11 +346,11 @@ class DripApp(QObject):
             if success:
                 logger.info("Automatic review session completed")
             
-            # Schedule next review regardless of success
-            self.schedule_next_review()
+            # Schedule next review regardless of success (interval already computed by the session)
+            self.schedule_next_review(next_interval)
             
-        except Exception as e:
-            logger.error(f"Failed to start automatic review: {e}")
+        except Exception:
+            logger.exception("Failed to start automatic review")
             # Still schedule next review on error
             self.schedule_next_review()
     
@@ -306,8 +379,12 @@ class DripApp(QObject):
             # Log result
             if result['success']:
                 if result['inserted_count'] > 0:
-                    logger.info(f"Auto-insert: {result['message']}")
+                    logger.info("Auto-insert: %s", result['message'])
+                    # Refresh cached priority scores for the new words in the background
+                    self.database_manager.request_score_refresh()
+                    
                     # Show modal notification if words were added
+                    from src.ui.notification_modal import show_vocabulary_added_notification
                     show_vocabulary_added_notification(result['inserted_count'], auto_close_seconds=4)
                     
                     # Also show system tray notification as backup
@@ -321,14 +398,14 @@ class DripApp(QObject):
                     # Timer will automatically stop since it's single-shot
                     logger.info("Auto-insert completed successfully, timer stopped")
                 else:
-                    logger.info(f"Auto-insert: {result['message']}")
+                    logger.info("Auto-insert: %s", result['message'])
                     # Timer will automatically stop since it's single-shot
             else:
-                logger.warning(f"Auto-insert failed: {result['message']}")
+                logger.warning("Auto-insert failed: %s", result['message'])
                 # Timer will automatically stop since it's single-shot
                 
-        except Exception as e:
-            logger.error(f"Error in auto-insert check: {e}")
+        except Exception:
+            logger.exception("Error in auto-insert check")
     
     def setup_auto_insert_timer(self):
         """Setup precise timer for auto-insert checking"""
@@ -354,7 +431,7 @@ class DripApp(QObject):
             
             # If target time has passed today, don't set timer
             if current_time >= target_datetime:
-                logger.info(f"Target time {target_hour:02d}:{target_minute:02d} has passed, timer not set")
+                logger.info("Target time %02d:%02d has passed, timer not set", target_hour, target_minute)
                 return
             
             # Calculate milliseconds until target time + 1 minute buffer to ensure we pass the target time
@@ -363,11 +440,11 @@ class DripApp(QObject):
             # Start timer to trigger exactly at target time
             self.auto_insert_timer.start(int(time_until_target))
             
-            logger.info(f"Auto-insert timer set for {target_hour:02d}:{target_minute:02d} "
-                       f"({time_until_target/1000/60:.1f} minutes from now)")
+            logger.info("Auto-insert timer set for %02d:%02d (%.1f minutes from now)",
+                        target_hour, target_minute, time_until_target / 1000 / 60)
             
-        except Exception as e:
-            logger.error(f"Error setting up auto-insert timer: {e}")
+        except Exception:
+            logger.exception("Error setting up auto-insert timer")
     
     def load_auto_insert_settings(self):
         """Load auto-insert settings from settings file"""
@@ -392,8 +469,8 @@ class DripApp(QObject):
                     'hour': 7,
                     'minute': 0
                 }
-        except Exception as e:
-            logger.error(f"Error loading auto-insert settings: {e}")
+        except Exception:
+            logger.exception("Error loading auto-insert settings")
             return {
                 'enabled': False,
                 'daily_count': 10,
@@ -402,32 +479,40 @@ class DripApp(QObject):
             }
 
     def check_startup_reviews(self):
-        """Check for overdue flashcards on startup"""
-        try:
-            due_flashcards = self.database_manager.get_due_flashcards(limit=1)
-            
-            if due_flashcards:
-                logger.info(f"Found {len(due_flashcards)} overdue flashcards on startup, triggering review")
-                # Trigger review after 3 seconds to let UI settle
-                self.review_timer.singleShot(3000, self.start_automatic_review)
-            else:
+        """Check for overdue flashcards on startup
+        
+        The query runs on a pool thread so the tray appears without waiting on SQLite;
+        the result comes back on the GUI thread in on_startup_reviews_checked.
+        """
+        QThreadPool.globalInstance().start(
+            _StartupReviewCheckTask(self.database_manager, self.startup_reviews_checked)
+        )
+    
+    def on_startup_reviews_checked(self, due_count):
+        """Start the first review (or normal scheduling) once the startup check finished"""
+        if due_count > 0:
+            logger.info("Found %d overdue flashcards on startup, triggering review", due_count)
+            # Trigger review after 3 seconds to let UI settle
+            self.startup_review_timer.start(3000)
+        else:
+            if due_count == 0:
                 logger.info("No overdue flashcards on startup")
-                # Start normal scheduling
-                self.schedule_next_review()
-                
-        except Exception as e:
-            logger.error(f"Error checking startup reviews: {e}")
-            # Fallback to normal scheduling
+            # Start normal scheduling (also the fallback when the check failed)
             self.schedule_next_review()
     
-    def schedule_next_review(self):
-        """Schedule next automatic review based on calculated interval"""
+    def schedule_next_review(self, next_interval_minutes: Optional[int] = None):
+        """Schedule next automatic review based on calculated interval
+        
+        Review sessions already compute the interval after updating card states - pass it in
+        to avoid querying the database a second time.
+        """
         try:
             # Don't check for overdue flashcards here - let the timer run its natural cycle
             # This prevents continuous checking and respects TIMEOUT/ESCAPE cooldowns
             
             # Get next review interval from database manager
-            next_interval_minutes = self.database_manager.calculate_next_test_interval()
+            if next_interval_minutes is None:
+                next_interval_minutes = self.database_manager.calculate_next_test_interval()
             
             # Convert to milliseconds for QTimer
             next_interval_ms = next_interval_minutes * 60 * 1000
@@ -436,10 +521,10 @@ class DripApp(QObject):
             self.review_timer.stop()
             self.review_timer.start(next_interval_ms)
             
-            logger.info(f"Next review scheduled in {next_interval_minutes} minutes")
+            logger.info("Next review scheduled in %d minutes", next_interval_minutes)
             
-        except Exception as e:
-            logger.error(f"Failed to schedule next review: {e}")
+        except Exception:
+            logger.exception("Failed to schedule next review")
             # Fallback to 30 minutes
             self.review_timer.start(30 * 60 * 1000)
     
@@ -447,14 +532,15 @@ class DripApp(QObject):
         """Show settings window"""
         try:
             if not self.settings_window:
+                from src.ui.settings_window import SettingsWindow
                 self.settings_window = SettingsWindow()
                 # Connect settings updated signal
                 self.settings_window.settings_updated.connect(self.on_settings_updated)
             
             self.settings_window.show_settings()
             
-        except Exception as e:
-            logger.error(f"Failed to show settings window: {e}")
+        except Exception:
+            logger.exception("Failed to show settings window")
     
     def on_settings_updated(self):
         """Handle settings update"""
@@ -470,8 +556,16 @@ class DripApp(QObject):
         
         # Stop timers
         self.review_timer.stop()
+        self.review_retry_timer.stop()
+        self.startup_review_timer.stop()
         self.auto_insert_timer.stop()
         
+        # Release OS hotkeys / stop the pynput listener
+        if self.native_hotkeys:
+            self.native_hotkeys.unregister_all()
+        if self.hotkey_listener:
+            self.hotkey_listener.stop()
+        
         # Close any open windows
         if self.create_flashcard_window:
             self.create_flashcard_window.close()
@@ -479,6 +573,13 @@ class DripApp(QObject):
         if self.settings_window:
             self.settings_window.close()
         
+        # Stop the priority-score worker and close database connections
+        self.database_manager.close()
+        self.auto_insert_manager.close()
+        
+        # Stop accepting hand-overs from new launches
+        self.instance_server.close()
+        
         # Hide system tray
         self.tray_icon.hide()
         
@@ -491,20 +592,25 @@ class DripApp(QObject):
         try:
             logger.info("Starting Drip application")
             return self.app.exec_()
-        except Exception as e:
-            logger.error(f"Application crashed: {e}")
+        except Exception:
+            logger.exception("Application crashed")
             return 1
 
 def main():
     """Main entry point"""
     try:
+        # A second launch only hands over to the running instance
+        if notify_running_instance():
+            logger.info("Drip is already running - opened its create flashcard window")
+            return 0
+        
         app = DripApp()
         return app.run()
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
         return 0
-    except Exception as e:
-        logger.error(f"Fatal error: {e}")
+    except Exception:
+        logger.exception("Fatal error")
         return 1
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 from typing import Tuple, List, Optional
 import logging
+import threading
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QEventLoop, QTimer, QRunnable, QThreadPool
 
 from src.database.database_manager import DatabaseManager, FlashCard
 from src.ui.reviewer_module import ReviewerModule
@@ -8,6 +10,34 @@ from src.ui.pre_review_notification import PreReviewNotification
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for waiting on the background contextual pools when the review opens
+CONTEXT_WAIT_SECONDS = 2.0
+
+class _ContextPools:
+    """Contextual word and meaning pools filled in by _PrepareContextTask"""
+    
+    def __init__(self):
+        self.contextual_words = []
+        self.contextual_meanings = []
+        self.done = threading.Event()
+
+class _PrepareContextTask(QRunnable):
+    """Build the contextual word and meaning pools on a pool thread while the user reads the notification"""
+    
+    def __init__(self, schedule_maker, flashcards, pools):
+        super().__init__()
+        # Auto-deleted by the pool; results go to pools so dropping them early is safe
+        self.schedule_maker = schedule_maker
+        self.flashcards = flashcards
+        self.pools = pools
+    
+    def run(self):
+        try:
+            self.pools.contextual_words = self.schedule_maker.prepare_contextual_words(self.flashcards)
+            self.pools.contextual_meanings = self.schedule_maker.prepare_contextual_meanings(self.flashcards)
+        finally:
+            self.pools.done.set()
+
 class ReviewerScheduleMaker:
     def __init__(self, database_manager: DatabaseManager):
         self.database_manager = database_manager
@@ -17,6 +47,7 @@ class ReviewerScheduleMaker:
         self.pending_flashcards = []
         self.pending_contextual_words = []
         self.pending_contextual_meanings = []
+        self.pending_context_pools = None
         
         # Timeout settings for each stage (in seconds)
         self.stage_timeouts = {
@@ -45,14 +76,14 @@ class ReviewerScheduleMaker:
             
             logger.info(f"Starting review session with {len(due_flashcards)} flashcards")
             
-            # Feature 2: Prepare Review Data
-            contextual_words = self.prepare_contextual_words(due_flashcards)
-            contextual_meanings = self.prepare_contextual_meanings(due_flashcards)
-            
             # Store pending session data
             self.pending_flashcards = due_flashcards
-            self.pending_contextual_words = contextual_words
-            self.pending_contextual_meanings = contextual_meanings
+            self.pending_contextual_words = []
+            self.pending_contextual_meanings = []
+            
+            # Feature 2: Prepare Review Data in the background, only needed once the user accepts
+            self.pending_context_pools = _ContextPools()
+            QThreadPool.globalInstance().start(_PrepareContextTask(self, due_flashcards, self.pending_context_pools))
             
             # Feature 3: Show Pre-Review Notification
             return self.show_pre_review_notification(len(due_flashcards))
@@ -72,19 +103,19 @@ class ReviewerScheduleMaker:
             List of contextual words for Stage 3 multiple choice options
         """
         try:
-            # Get contextual words for Stage 3 flashcards
-            contextual_words = []
-            
-            for flashcard in flashcards:
-                if flashcard.stage_id == 3:  # Only needed for stage 3 (multiple choice word)
-                    words = self.database_manager.get_contextual_words_for_stage3(
-                        exclude_id=flashcard.id, 
-                        count=5  # Get extra words for better randomization
-                    )
-                    contextual_words.extend(words)
+            # Only needed for stage 3 (multiple choice word)
+            stage3_ids = [flashcard.id for flashcard in flashcards if flashcard.stage_id == 3]
+            if not stage3_ids:
+                return []
+            
+            # One query for every Stage 3 flashcard of the session
+            contextual_words = self.database_manager.get_contextual_words_for_stage3_batch(
+                exclude_ids=stage3_ids,
+                count=5  # Get extra words for better randomization
+            )
             
-            # Remove duplicates and return
-            return list(set(contextual_words))
+            # Remove duplicates in one pass, keeping first-seen order
+            return list(dict.fromkeys(contextual_words))
             
         except Exception as e:
             logger.error(f"Error preparing contextual words: {e}")
@@ -101,19 +132,19 @@ class ReviewerScheduleMaker:
             List of contextual meanings for Stage 2 multiple choice options
         """
         try:
-            # Get contextual meanings for Stage 2 flashcards
-            contextual_meanings = []
-            
-            for flashcard in flashcards:
-                if flashcard.stage_id == 2:  # Only needed for stage 2 (multiple choice meaning)
-                    meanings = self.database_manager.get_contextual_meanings_for_stage2(
-                        exclude_id=flashcard.id, 
-                        count=5  # Get extra meanings for better randomization
-                    )
-                    contextual_meanings.extend(meanings)
+            # Only needed for stage 2 (multiple choice meaning)
+            stage2_ids = [flashcard.id for flashcard in flashcards if flashcard.stage_id == 2]
+            if not stage2_ids:
+                return []
+            
+            # One query for every Stage 2 flashcard of the session
+            contextual_meanings = self.database_manager.get_contextual_meanings_for_stage2_batch(
+                exclude_ids=stage2_ids,
+                count=5  # Get extra meanings for better randomization
+            )
             
-            # Remove duplicates and return
-            return list(set(contextual_meanings))
+            # Remove duplicates in one pass, keeping first-seen order
+            return list(dict.fromkeys(contextual_meanings))
             
         except Exception as e:
             logger.error(f"Error preparing contextual meanings: {e}")
@@ -150,18 +181,13 @@ class ReviewerScheduleMaker:
             # Show notification
             self.pre_review_notification.show_notification()
             
-            # Process Qt events to handle the notification
+            # Wait for the user's response, the accepted signal runs the whole review before returning
             app = QApplication.instance()
             if app:
-                import time
-                start_time = time.time()
-                timeout = 10  # 10 seconds max wait for notification response
-                
-                while (self.pre_review_notification and 
-                       self.pre_review_notification.isVisible() and 
-                       time.time() - start_time < timeout):
-                    app.processEvents()
-                    time.sleep(0.1)
+                notification = self.pre_review_notification
+                if notification.isVisible():
+                    # 10 seconds max wait for notification response
+                    self.wait_for_signal((notification.review_accepted, notification.review_declined), 10)
                 
                 # Check if we have results from the main review
                 if self.current_session_results:
@@ -190,6 +216,9 @@ class ReviewerScheduleMaker:
         try:
             logger.info("User accepted review - starting main review session")
             
+            # Usually finished already, the user needs longer than the queries to respond
+            self.collect_pending_context()
+            
             # Execute the main review session with pending data
             results = self.execute_review_session(
                 self.pending_flashcards, 
@@ -207,6 +236,25 @@ class ReviewerScheduleMaker:
             logger.error(f"Error proceeding with review: {e}")
             self.current_session_results = {}
     
+    def collect_pending_context(self):
+        """
+        Wait for the background contextual pools and store them as pending session data
+        """
+        pools = self.pending_context_pools
+        if pools is None:
+            return
+        
+        self.pending_context_pools = None
+        if not pools.done.wait(CONTEXT_WAIT_SECONDS):
+            # Don't block the GUI thread; the reviewer falls back to its default options
+            logger.warning(f"Contextual pools not ready after {CONTEXT_WAIT_SECONDS}s, starting review without them")
+            self.pending_contextual_words = []
+            self.pending_contextual_meanings = []
+            return
+        
+        self.pending_contextual_words = pools.contextual_words
+        self.pending_contextual_meanings = pools.contextual_meanings
+    
     def postpone_review(self):
         """
         User declined review or notification timed out - mark all as timeout
@@ -225,6 +273,7 @@ class ReviewerScheduleMaker:
             self.pending_flashcards = []
             self.pending_contextual_words = []
             self.pending_contextual_meanings = []
+            self.pending_context_pools = None
             
         except Exception as e:
             logger.error(f"Error postponing review: {e}")
@@ -253,6 +302,8 @@ class ReviewerScheduleMaker:
                     self.reviewer_module.review_completed.disconnect()
                 except:
                     pass  # Ignore if already disconnected
+                # Button slots reference the module, so the C++ side must be destroyed to release it
+                self.reviewer_module.deleteLater()
                 self.reviewer_module = None
             
             # Create new instance for this session
@@ -268,20 +319,15 @@ class ReviewerScheduleMaker:
             # Start the review session with stage-specific timeouts
             self.reviewer_module.start_review(flashcards, self.stage_timeouts, contextual_words, contextual_meanings)
             
-            # Process Qt events to handle the review session
-            # This is a simplified approach - in a real app, you'd use proper async handling
+            # Run the Qt event loop until the review completes
             app = QApplication.instance()
             if app:
-                # Wait for review to complete (with timeout)
-                import time
-                start_time = time.time()
                 # Calculate max timeout based on longest stage timeout
                 max_stage_timeout = max(self.stage_timeouts.values())
                 timeout = len(flashcards) * max_stage_timeout + 30  # Extra time for user interaction
                 
-                while not self.current_session_results and time.time() - start_time < timeout:
-                    app.processEvents()
-                    time.sleep(0.1)
+                if not self.current_session_results:
+                    self.wait_for_signal((self.reviewer_module.review_completed,), timeout)
                 
                 if self.current_session_results:
                     return self.current_session_results
@@ -296,6 +342,28 @@ class ReviewerScheduleMaker:
             logger.error(f"Error executing review session: {e}")
             return None
     
+    def wait_for_signal(self, signals, timeout_seconds: float):
+        """
+        Run a nested Qt event loop until one of the signals fires or the timeout expires
+        
+        Args:
+            signals: Bound signals that end the wait
+            timeout_seconds: Maximum time to wait
+        """
+        loop = QEventLoop()
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(loop.quit)
+        for signal in signals:
+            signal.connect(loop.quit)
+        
+        timer.start(int(timeout_seconds * 1000))
+        loop.exec_()
+        timer.stop()
+        
+        for signal in signals:
+            signal.disconnect(loop.quit)
+    
     def on_review_completed(self, results: dict):
         """
         Handle review completion signal from ReviewerModule
@@ -316,7 +384,9 @@ class ReviewerScheduleMaker:
         try:
             for flashcard_id, result in results.items():
                 logger.info(f"Updating flashcard {flashcard_id} with result: {result}")
-                self.database_manager.update_flashcard_after_review(flashcard_id, result)
+            
+            # One transaction for the whole session
+            self.database_manager.update_flashcards_after_review_bulk(results)
                 
             logger.info(f"Updated {len(results)} flashcards with review results")
             
@@ -360,6 +430,7 @@ class ReviewerScheduleMaker:
         try:
             if self.reviewer_module:
                 self.reviewer_module.close()
+                self.reviewer_module.deleteLater()
                 self.reviewer_module = None
             
             if self.pre_review_notification:
@@ -375,6 +446,7 @@ class ReviewerScheduleMaker:
             self.pending_flashcards = []
             self.pending_contextual_words = []
             self.pending_contextual_meanings = []
+            self.pending_context_pools = None
             
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
@@ -401,47 +473,29 @@ class ReviewerScheduleMaker:
         """
         try:
             # Get any flashcards (not just due ones)
-            from src.database.database_manager import DatabaseManager
+            flashcards = self.database_manager.get_any_flashcards(limit)
             
-            with DatabaseManager(self.database_manager.db_path).database_manager.db_path as db_path:
-                import sqlite3
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
-                
-                # Get any flashcards for forced review
-                cursor.execute("""
-                    SELECT * FROM flashcards 
-                    ORDER BY priority_score DESC, created_at DESC
-                    LIMIT ?
-                """, (limit,))
-                
-                rows = cursor.fetchall()
-                conn.close()
-                
-                if not rows:
-                    logger.info("No flashcards available for forced review")
-                    return False, 30  # Default 30 minutes
-                
-                # Convert to FlashCard objects
-                flashcards = [self.database_manager._row_to_flashcard(row) for row in rows]
-                
-                logger.info(f"Starting forced review session with {len(flashcards)} flashcards")
-                
-                # Use the same process as normal review
-                contextual_words = self.prepare_contextual_words(flashcards)
-                contextual_meanings = self.prepare_contextual_meanings(flashcards)
-                
-                results = self.execute_review_session(flashcards, contextual_words, contextual_meanings)
-                
-                if results is None:
-                    logger.info("Forced review session was cancelled or failed")
-                    return False, 30
-                
-                self.update_flashcard_results(results)
-                next_interval = self.database_manager.calculate_next_test_interval()
-                
-                logger.info(f"Forced review session completed successfully. Next session in {next_interval} minutes")
-                return True, next_interval
+            if not flashcards:
+                logger.info("No flashcards available for forced review")
+                return False, 30  # Default 30 minutes
+            
+            logger.info(f"Starting forced review session with {len(flashcards)} flashcards")
+            
+            # Use the same process as normal review
+            contextual_words = self.prepare_contextual_words(flashcards)
+            contextual_meanings = self.prepare_contextual_meanings(flashcards)
+            
+            results = self.execute_review_session(flashcards, contextual_words, contextual_meanings)
+            
+            if results is None:
+                logger.info("Forced review session was cancelled or failed")
+                return False, 30
+            
+            self.update_flashcard_results(results)
+            next_interval = self.database_manager.calculate_next_test_interval()
+            
+            logger.info(f"Forced review session completed successfully. Next session in {next_interval} minutes")
+            return True, next_interval
                 
         except Exception as e:
             logger.error(f"Error in forced review session: {e}")
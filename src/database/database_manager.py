@@ -1,11 +1,47 @@
+import json
 import sqlite3
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from pathlib import Path
 from typing import List, Dict, Optional
+import queue
 import random
+import threading
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Từ / nghĩa mặc định để bổ sung đáp án multiple choice khi database không đủ dữ liệu
+_DEFAULT_WORDS = (
+    "apple", "book", "cat", "dog", "elephant",
+    "flower", "guitar", "house", "computer", "phone",
+    "chair", "table", "water", "coffee", "music",
+    "movie", "garden", "window", "door", "street",
+)
+
+_DEFAULT_MEANINGS = (
+    "a red fruit that grows on trees",
+    "an object with pages for reading",
+    "a small animal that says meow",
+    "a loyal pet animal",
+    "a large gray animal with a trunk",
+    "a colorful plant that blooms",
+    "a musical instrument with strings",
+    "a building where people live",
+    "a yellow fruit that monkeys like",
+    "a vehicle with four wheels",
+    "a device for communication",
+    "a piece of furniture for sitting",
+    "a liquid that falls from the sky",
+    "a bright object in the sky",
+    "a green plant that grows in lawns",
+    "a tool for writing",
+    "a container for drinking",
+    "a place where people work",
+    "a time when the sun sets",
+    "a feeling of happiness",
+)
+
 class FlashCard:
     def __init__(self, id=None, word="", meaning="", example="", tag="", 
                  stage_id=1, correct=None, created_at=None, last_reviewed_at=None,
@@ -26,15 +62,162 @@ class FlashCard:
         self.wrong_count = wrong_count
         self.priority_score = priority_score
         self.interval_hours = interval_hours
+    
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "FlashCard":
+        """Tạo FlashCard từ sqlite3.Row (truy cập theo tên cột, không phụ thuộc thứ tự cột)"""
+        return cls(
+            id=row["id"],
+            word=row["word"],
+            meaning=row["meaning"],
+            example=row["example"],
+            tag=row["tag"],
+            stage_id=row["stage_id"],
+            correct=row["correct"],
+            created_at=row["created_at"],
+            last_reviewed_at=row["last_reviewed_at"],
+            next_review_time=row["next_review_time"],
+            review_count=row["review_count"],
+            correct_count=row["correct_count"],
+            wrong_count=row["wrong_count"],
+            priority_score=row["priority_score"],
+            interval_hours=row["interval_hours"]
+        )
 
 class DatabaseManager:
-    def __init__(self, db_path: str = "data/drip.db"):
+    # PRAGMAs applied to every connection (journal_mode=WAL is persistent and set once in init_database)
+    CONNECTION_PRAGMAS = (
+        "PRAGMA foreign_keys=ON",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=134217728",
+        "PRAGMA cache_size=-20000",
+        "PRAGMA wal_autocheckpoint=1000",
+    )
+    
+    # Chu kỳ làm mới priority_score (giây) của worker thread
+    SCORE_REFRESH_SECONDS = 60
+    
+    # Mọi câu SQL đều có text cố định (danh sách tham số truyền qua json_each) nên được cache lại
+    STATEMENT_CACHE_SIZE = 256
+    
+    INDEX_STATEMENTS = (
+        "CREATE INDEX IF NOT EXISTS idx_stage_review ON flashcards(stage_id, next_review_time)",
+        # Khớp đúng ORDER BY của force review (priority_score DESC, created_at DESC) -> không cần sort,
+        # thay cho idx_priority(priority_score DESC) cũ
+        "DROP INDEX IF EXISTS idx_priority",
+        "CREATE INDEX IF NOT EXISTS idx_priority_sort ON flashcards(priority_score DESC, created_at DESC)",
+        # Các truy vấn due (get_due_flashcards, calculate_next_test_interval) lọc theo next_review_time;
+        # idx_due_covering cũ trùng tiền tố mà không phủ được SELECT * nên bỏ đi cho nhẹ phần ghi
+        "DROP INDEX IF EXISTS idx_due_covering",
+        "CREATE INDEX IF NOT EXISTS idx_next_review ON flashcards(next_review_time)",
+    )
+    
+    # Thuật toán 1 (_calculate_priority_score) viết bằng SQL, tham số :now (unix epoch)
+    PRIORITY_SCORE_SQL = """CAST((
+        CASE stage_id WHEN 1 THEN 100 WHEN 2 THEN 80 WHEN 3 THEN 60 WHEN 4 THEN 40 ELSE 20 END
+        + COALESCE(MIN(50, MAX(0, (:now - next_review_time) / 3600.0 * 5)), 0)
+        + CASE WHEN correct = 0 THEN 30 ELSE 0 END
+        + CASE WHEN stage_id = 1 THEN 20 ELSE 0 END
+    ) AS REAL)"""
+    
+    def __init__(self, db_path: str = "data/drip.db", pool_size: int = 4):
         self.db_path = db_path
+        
+        # Giá trị contextual trong khoảng ±10 ID của từng flashcard, xem _get_contextual_values
+        self._contextual_cache = {"version": None, "word": {}, "meaning": {}}
+        
+        # Connection pool: 1 connection ghi (serialize bằng lock) + (pool_size - 1) connection chỉ đọc
+        self._write_lock = threading.RLock()
+        self._write_conn = self._connect()
+        self._read_pool = queue.LifoQueue()
+        
         self.init_database()
+        
+        # Read-only connections chỉ mở được sau khi file database đã tồn tại
+        for _ in range(max(1, pool_size - 1)):
+            self._read_pool.put(self._connect(read_only=True))
+        
+        # priority_score lưu trong bảng chỉ là cache (get_due_flashcards tính trực tiếp khi query),
+        # được làm mới bởi worker thread chạy nền (ngay khi khởi động, sau đó mỗi SCORE_REFRESH_SECONDS)
+        self._closed = threading.Event()
+        self._score_refresh_event = threading.Event()
+        self._score_refresh_event.set()
+        self._score_thread = threading.Thread(target=self._score_worker, name="priority-score-worker", daemon=True)
+        self._score_thread.start()
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Mở connection với các PRAGMA đã tinh chỉnh (WAL + synchronous=NORMAL)"""
+        if read_only:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                                   cached_statements=self.STATEMENT_CACHE_SIZE)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=self.STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        for pragma in self.CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _conn(self, write: bool = False):
+        """Mượn một connection từ pool
+        
+        write=True: dùng connection ghi duy nhất (giữ lock, commit khi thành công, rollback khi lỗi)
+        write=False: dùng một connection chỉ đọc từ pool
+        """
+        if write:
+            with self._write_lock:
+                try:
+                    yield self._write_conn
+                    self._write_conn.commit()
+                except Exception:
+                    self._write_conn.rollback()
+                    raise
+        else:
+            conn = self._read_pool.get()
+            try:
+                yield conn
+            finally:
+                self._read_pool.put(conn)
+    
+    def _score_worker(self):
+        """Worker thread: làm mới priority_score định kỳ hoặc khi được yêu cầu (request_score_refresh)"""
+        while not self._closed.is_set():
+            self._score_refresh_event.wait(self.SCORE_REFRESH_SECONDS)
+            if self._closed.is_set():
+                break
+            self._score_refresh_event.clear()
+            try:
+                self._update_all_priority_scores()
+            except Exception as e:
+                logger.error(f"Error refreshing priority scores: {e}")
+    
+    def request_score_refresh(self):
+        """Yêu cầu worker làm mới priority_score ngay (ví dụ sau khi import nhiều từ)"""
+        self._score_refresh_event.set()
+    
+    def close(self):
+        """Dừng worker thread và đóng tất cả connection trong pool"""
+        self._closed.set()
+        self._score_refresh_event.set()
+        if self._score_thread is not threading.current_thread():
+            self._score_thread.join(timeout=5)
+        
+        with self._write_lock:
+            self._write_conn.close()
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
     
     def init_database(self):
         """Khởi tạo database cơ bản"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn(write=True) as conn:
+            # WAL: commit không cần fsync đầy đủ, reader không chặn writer
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS flashcards (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -44,9 +227,9 @@ class DatabaseManager:
                     tag TEXT,
                     stage_id INTEGER NOT NULL DEFAULT 1,
                     correct BOOLEAN DEFAULT NULL,
-                    created_at TIMESTAMP DEFAULT NULL,
-                    last_reviewed_at TIMESTAMP DEFAULT NULL,
-                    next_review_time TIMESTAMP DEFAULT NULL,
+                    created_at INTEGER DEFAULT NULL,
+                    last_reviewed_at INTEGER DEFAULT NULL,
+                    next_review_time INTEGER DEFAULT NULL,
                     review_count INTEGER DEFAULT 0,
                     correct_count INTEGER DEFAULT 0,
                     wrong_count INTEGER DEFAULT 0,
@@ -55,20 +238,42 @@ class DatabaseManager:
                     CHECK (stage_id IN (1, 2, 3, 4, 5))
                 )
             """)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_stage_review ON flashcards(stage_id, next_review_time)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_priority ON flashcards(priority_score DESC)")
+            for index_sql in self.INDEX_STATEMENTS:
+                conn.execute(index_sql)
             
             # Migration: Update constraint to support stage 5 if needed
             self._migrate_stage_constraint()
             
+            # Migration: Chuyển timestamp dạng TEXT sang unix epoch (INTEGER)
+            self._migrate_timestamps_to_epoch()
+            
+            # Cập nhật sqlite_stat1 để query planner chọn đúng index
+            conn.execute("ANALYZE flashcards")
+            
             conn.commit()
     
+    def _migrate_timestamps_to_epoch(self):
+        """Chuyển created_at/last_reviewed_at/next_review_time từ chuỗi ISO (local time) sang unix epoch"""
+        try:
+            with self._conn(write=True) as conn:
+                for column in ("created_at", "last_reviewed_at", "next_review_time"):
+                    # 'utc' modifier: chuỗi cũ lưu theo local time
+                    cursor = conn.execute(f"""
+                        UPDATE flashcards 
+                        SET {column} = CAST(strftime('%s', {column}, 'utc') AS INTEGER)
+                        WHERE typeof({column}) = 'text'
+                    """)
+                    if cursor.rowcount:
+                        logger.info(f"Migrated {cursor.rowcount} {column} values to unix epoch")
+        except Exception as e:
+            logger.error(f"Error during timestamp migration: {e}")
+    
     def _migrate_stage_constraint(self):
         """Migrate database to support stage 5 if constraint is old"""
         try:
             # Test if we can insert stage 5 - if not, need to recreate table
             try:
-                with sqlite3.connect(self.db_path) as test_conn:
+                with self._conn(write=True) as test_conn:
                     test_conn.execute("INSERT INTO flashcards (word, meaning, stage_id) VALUES ('test_stage_5', 'test', 5)")
                     test_conn.execute("DELETE FROM flashcards WHERE word = 'test_stage_5'")
                     test_conn.commit()
@@ -83,7 +288,7 @@ class DatabaseManager:
     def _recreate_table_with_new_constraint(self):
         """Recreate flashcards table with updated constraint for stage 5"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn(write=True) as conn:
                 # Create backup table
                 conn.execute("""
                     CREATE TABLE flashcards_backup AS 
@@ -103,9 +308,9 @@ class DatabaseManager:
                         tag TEXT,
                         stage_id INTEGER NOT NULL DEFAULT 1,
                         correct BOOLEAN DEFAULT NULL,
-                        created_at TIMESTAMP DEFAULT NULL,
-                        last_reviewed_at TIMESTAMP DEFAULT NULL,
-                        next_review_time TIMESTAMP DEFAULT NULL,
+                        created_at INTEGER DEFAULT NULL,
+                        last_reviewed_at INTEGER DEFAULT NULL,
+                        next_review_time INTEGER DEFAULT NULL,
                         review_count INTEGER DEFAULT 0,
                         correct_count INTEGER DEFAULT 0,
                         wrong_count INTEGER DEFAULT 0,
@@ -125,8 +330,8 @@ class DatabaseManager:
                 conn.execute("DROP TABLE flashcards_backup")
                 
                 # Recreate indexes
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_stage_review ON flashcards(stage_id, next_review_time)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_priority ON flashcards(priority_score DESC)")
+                for index_sql in self.INDEX_STATEMENTS:
+                    conn.execute(index_sql)
                 
                 conn.commit()
                 logger.info("Successfully migrated database to support stage 5")
@@ -137,11 +342,11 @@ class DatabaseManager:
     
     def create_flashcard(self, flashcard_data: Dict) -> int:
         """Tạo flashcard mới từ modal CreateNewFlashcard"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn(write=True) as conn:
             cursor = conn.cursor()
-            # Sử dụng local time cho cả created_at và next_review_time
-            current_time = datetime.now()
-            first_review_time = current_time + timedelta(hours=0.5)
+            # created_at và next_review_time lưu dạng unix epoch (giây)
+            current_time = int(time.time())
+            first_review_time = current_time + 30 * 60
             
             cursor.execute("""
                 INSERT INTO flashcards (word, meaning, example, tag, stage_id, 
@@ -160,176 +365,277 @@ class DatabaseManager:
     
     def get_due_flashcards(self, limit: int = 5) -> List[FlashCard]:
         """Lấy danh sách flashcard cần ôn tập theo độ ưu tiên (Thuật toán 1)"""
-        # Trước tiên cập nhật priority_score cho tất cả flashcard
-        self._update_all_priority_scores()
-        
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            # Tính priority trực tiếp trong câu SELECT (chỉ cho các từ due) và sắp xếp DESC (cao trước)
+            cursor.execute(f"""
+                SELECT *, {self.PRIORITY_SCORE_SQL} AS live_priority FROM flashcards 
+                WHERE next_review_time <= :now 
+                ORDER BY live_priority DESC, stage_id ASC, next_review_time ASC
+                LIMIT :limit
+            """, {"now": int(time.time()), "limit": limit})
+            
+            flashcards = []
+            for row in cursor.fetchall():
+                flashcard = FlashCard.from_row(row)
+                flashcard.priority_score = row["live_priority"]
+                flashcards.append(flashcard)
+            return flashcards
+    
+    def get_any_flashcards(self, limit: int = 5) -> List[FlashCard]:
+        """Lấy flashcard bất kỳ (không cần due) cho force review, theo idx_priority_sort"""
+        with self._conn() as conn:
             cursor = conn.cursor()
-            # Sắp xếp theo priority_score DESC (cao trước)
             cursor.execute("""
                 SELECT * FROM flashcards 
-                WHERE next_review_time <= ? 
-                ORDER BY priority_score DESC, stage_id ASC, next_review_time ASC
+                ORDER BY priority_score DESC, created_at DESC
                 LIMIT ?
-            """, (datetime.now(), limit))
-            
-            results = cursor.fetchall()
-            return [self._row_to_flashcard(row) for row in results]
+            """, (limit,))
+            return [FlashCard.from_row(row) for row in cursor.fetchall()]
     
     def update_flashcard_after_review(self, flashcard_id: int, result: str):
         """Cập nhật flashcard sau khi review (Thuật toán 2 - Interval)"""
-        with sqlite3.connect(self.db_path) as conn:
+        self.update_flashcards_after_review_bulk({flashcard_id: result})
+    
+    def update_flashcards_after_review_bulk(self, results: Dict[int, str]):
+        """Cập nhật các flashcard của cả phiên review (Thuật toán 2 - Interval)
+        
+        Một câu SELECT cho mọi flashcard, giá trị mới tính bằng Python, ghi bằng executemany
+        trong cùng một transaction (một commit cho cả phiên thay vì mỗi flashcard một commit)
+        """
+        if not results:
+            return
+        
+        # Lấy thời gian một lần, dùng chung cho last_reviewed_at, next_review_time và priority_score
+        now = int(time.time())
+        timeout_rows, correct_rows, wrong_rows = [], [], []
+        
+        with self._conn(write=True) as conn:
             cursor = conn.cursor()
             
-            # Lấy flashcard hiện tại để check stage
-            cursor.execute("SELECT * FROM flashcards WHERE id = ?", (flashcard_id,))
-            row = cursor.fetchone()
-            if not row:
-                return
-            
-            flashcard = self._row_to_flashcard(row)
+            # Lấy các flashcard hiện tại để check stage - chỉ các cột cần cho interval và priority_score
+            cursor.execute("""
+                SELECT id, stage_id, correct, next_review_time, review_count, correct_count, wrong_count
+                FROM flashcards WHERE id IN (SELECT value FROM json_each(?))
+            """, (json.dumps(list(results)),))
             
-            # Xử lý TIMEOUT dựa trên stage
-            if result == "TIMEOUT":
-                # Tất cả stages: TIMEOUT từ pre-review notification không nên thay đổi next_review_time
-                # Giữ nguyên thời gian review để flashcard vẫn due cho đợt review tiếp theo
-                cursor.execute("""
-                    UPDATE flashcards 
-                    SET last_reviewed_at = ?, review_count = ?
-                    WHERE id = ?
-                """, (datetime.now(), flashcard.review_count + 1, flashcard_id))
-                conn.commit()
-                self._update_priority_score(flashcard_id)
-                return
+            for row in cursor.fetchall():
+                flashcard_id = row["id"]
+                result = results[flashcard_id]
+                flashcard = FlashCard(
+                    id=flashcard_id,
+                    stage_id=row["stage_id"],
+                    correct=row["correct"],
+                    next_review_time=row["next_review_time"],
+                    review_count=row["review_count"],
+                    correct_count=row["correct_count"],
+                    wrong_count=row["wrong_count"]
+                )
+                
+                # Xử lý TIMEOUT / ESCAPE dựa trên stage
+                if result in ("TIMEOUT", "ESCAPE"):
+                    # Tất cả stages: TIMEOUT/ESCAPE từ pre-review notification không nên thay đổi next_review_time
+                    # Giữ nguyên thời gian review để flashcard vẫn due cho đợt review tiếp theo
+                    flashcard.last_reviewed_at = now
+                    flashcard.review_count += 1
+                    timeout_rows.append((flashcard.last_reviewed_at, flashcard.review_count,
+                                         self._calculate_priority_score(flashcard, now), flashcard_id))
+                    continue
+                
+                # Tiếp tục xử lý logic chính cho tất cả results khác (chỉ "True" và "False")
+                
+                # Tính interval mới theo thuật toán
+                new_interval = self._calculate_next_interval(flashcard, result)
+                next_review = int(now + new_interval * 3600)
+                
+                if result == "True":  # Đúng
+                    new_stage = min(flashcard.stage_id + 1, 5)
+                    # priority_score tính từ trạng thái mới, ghi trong cùng câu UPDATE
+                    flashcard.stage_id, flashcard.correct, flashcard.next_review_time = new_stage, True, next_review
+                    correct_rows.append((new_stage, True, now, next_review,
+                                         flashcard.review_count + 1, flashcard.correct_count + 1,
+                                         new_interval, self._calculate_priority_score(flashcard, now), flashcard_id))
+                    
+                elif result == "False":  # Sai
+                    flashcard.correct, flashcard.next_review_time = False, next_review
+                    wrong_rows.append((False, now, next_review, flashcard.review_count + 1,
+                                       flashcard.wrong_count + 1, new_interval,
+                                       self._calculate_priority_score(flashcard, now), flashcard_id))
             
-            # Xử lý ESCAPE key - tương tự như TIMEOUT
-            if result == "ESCAPE":
-                # Tất cả stages: ESCAPE từ pre-review notification không nên thay đổi next_review_time
-                # Giữ nguyên thời gian review để flashcard vẫn due cho đợt review tiếp theo
-                cursor.execute("""
+            if timeout_rows:
+                cursor.executemany("""
                     UPDATE flashcards 
-                    SET last_reviewed_at = ?, review_count = ?
+                    SET last_reviewed_at = ?, review_count = ?, priority_score = ?
                     WHERE id = ?
-                """, (datetime.now(), flashcard.review_count + 1, flashcard_id))
-                conn.commit()
-                self._update_priority_score(flashcard_id)
-                return
-            
-            # Tiếp tục xử lý logic chính cho tất cả results khác (chỉ "True" và "False")
-            
-            # Tính interval mới theo thuật toán
-            new_interval = self._calculate_next_interval(flashcard, result)
-            next_review = datetime.now() + timedelta(hours=new_interval)
-            now = datetime.now()
-            
-            if result == "True":  # Đúng
-                new_stage = min(flashcard.stage_id + 1, 5)
-                cursor.execute("""
+                """, timeout_rows)
+            if correct_rows:
+                cursor.executemany("""
                     UPDATE flashcards 
                     SET stage_id = ?, correct = ?, last_reviewed_at = ?, 
                         next_review_time = ?, review_count = ?, 
-                        correct_count = ?, interval_hours = ?
+                        correct_count = ?, interval_hours = ?, priority_score = ?
                     WHERE id = ?
-                """, (new_stage, True, now, next_review, 
-                      flashcard.review_count + 1, flashcard.correct_count + 1, 
-                      new_interval, flashcard_id))
-                
-            elif result == "False":  # Sai
-                cursor.execute("""
+                """, correct_rows)
+            if wrong_rows:
+                cursor.executemany("""
                     UPDATE flashcards 
                     SET correct = ?, last_reviewed_at = ?, 
                         next_review_time = ?, review_count = ?, 
-                        wrong_count = ?, interval_hours = ?
+                        wrong_count = ?, interval_hours = ?, priority_score = ?
                     WHERE id = ?
-                """, (False, now, next_review, flashcard.review_count + 1,
-                      flashcard.wrong_count + 1, new_interval, flashcard_id))
-            
-            conn.commit()
-            
-            # Cập nhật priority_score sau khi review
-            self._update_priority_score(flashcard_id)
+                """, wrong_rows)
     
     def get_random_words_for_options(self, exclude_id: int, count: int = 3) -> List[str]:
         """Lấy từ ngẫu nhiên cho bài test multiple choice (stage 3) - DEPRECATED
         
         Sử dụng get_contextual_words_for_stage3() thay thế
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT word FROM flashcards 
-                WHERE id != ? 
-                ORDER BY RANDOM() 
-                LIMIT ?
-            """, (exclude_id, count))
+        with self._conn() as conn:
+            words = self._sample_random_values(conn.cursor(), "word", count, exclude_id, exclude_id, [])
             
-            results = cursor.fetchall()
-            words = [row[0] for row in results]
-            
-            # Nếu không đủ từ trong database, thêm từ mặc định
-            default_words = ["apple", "book", "cat", "dog", "elephant", "flower", "guitar", "house"]
-            while len(words) < count:
-                for word in default_words:
-                    if word not in words and len(words) < count:
-                        words.append(word)
-                break
+            # Nếu không đủ từ trong database, thêm từ mặc định (8 từ đầu như trước)
+            seen = set(words)
+            for word in _DEFAULT_WORDS[:8]:
+                if len(words) >= count:
+                    break
+                if word not in seen:
+                    words.append(word)
+                    seen.add(word)
                         
             return words[:count]
     
-    def get_contextual_words_for_stage3(self, exclude_id: int, count: int = 3) -> List[str]:
-        """Lấy từ (words) contextual cho Stage 3 multiple choice
+    def _sample_random_values(self, cursor, column: str, count: int,
+                              exclude_low: int, exclude_high: int, skip: List[str]) -> List[str]:
+        """Lấy ngẫu nhiên tối đa count giá trị có id nằm ngoài [exclude_low, exclude_high]
         
-        Logic: Lấy từ 10 ID trước và 10 ID sau (tổng 20 từ) để gợi nhớ các từ đã học cùng thời điểm
-        Nếu không đủ thì bổ sung từ danh sách mặc định
+        Bốc ngẫu nhiên id trong khoảng 1..MAX(id) rồi tra theo primary key thay vì
+        ORDER BY RANDOM() (phải quét và sắp xếp toàn bộ bảng). Id bị xoá chỉ làm thiếu
+        kết quả, khi đó bốc thêm (tối đa 3 lần) hoặc để caller bổ sung giá trị mặc định.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Lấy words từ 10 ID trước và 10 ID sau
-            cursor.execute("""
-                SELECT word FROM flashcards 
-                WHERE id != ? AND (
-                    (id >= ? AND id <= ?) OR  -- 10 ID trước
-                    (id >= ? AND id <= ?)     -- 10 ID sau
-                )
-                ORDER BY id
-            """, (exclude_id, max(1, exclude_id - 10), exclude_id - 1, 
-                  exclude_id + 1, exclude_id + 10))
+        max_id = cursor.execute("SELECT MAX(id) FROM flashcards").fetchone()[0] or 0
+        excluded_count = max(0, exclude_high - exclude_low + 1)
+        
+        values = []
+        tried_ids = set()
+        for _ in range(3):
+            remaining = count - len(values)
+            if remaining <= 0 or len(tried_ids) >= max_id:
+                break
             
-            results = cursor.fetchall()
-            words = [row[0] for row in results]
+            sample_size = min(max_id, remaining * 3 + excluded_count)
+            candidate_ids = [i for i in random.sample(range(1, max_id + 1), sample_size)
+                             if i not in tried_ids and not exclude_low <= i <= exclude_high]
+            tried_ids.update(candidate_ids)
+            if not candidate_ids:
+                continue
             
-            # Nếu không đủ từ, lấy thêm từ database (ngẫu nhiên)
-            if len(words) < count:
-                cursor.execute("""
-                    SELECT word FROM flashcards 
-                    WHERE id != ? AND word NOT IN ({})
-                    ORDER BY RANDOM() 
-                    LIMIT ?
-                """.format(','.join(['?'] * len(words))), 
-                [exclude_id] + words + [count - len(words)])
-                
-                additional_results = cursor.fetchall()
-                words.extend([row[0] for row in additional_results])
+            # Loại các giá trị đã có ngay trong SQL (NOT IN json_each, text câu lệnh cố định)
+            cursor.execute(f"""
+                SELECT {column} FROM flashcards 
+                WHERE id IN (SELECT value FROM json_each(?))
+                  AND {column} NOT IN (SELECT value FROM json_each(?))
+            """, (json.dumps(candidate_ids), json.dumps(skip + values)))
+            for (value,) in cursor.fetchall():
+                if len(values) >= count:
+                    break
+                if value not in values:
+                    values.append(value)
+        
+        return values
+    
+    def get_flashcards_table_version(self, cursor=None):
+        """Phiên bản nội dung bảng flashcards (MAX(id), COUNT(*)), đổi khi có từ được thêm hoặc xoá
+        
+        Review chỉ cập nhật lịch ôn tập, không đổi word/meaning nên không làm đổi phiên bản
+        """
+        if cursor is not None:
+            return tuple(cursor.execute("SELECT MAX(id), COUNT(*) FROM flashcards").fetchone())
+        with self._conn() as conn:
+            return self.get_flashcards_table_version(conn.cursor())
+    
+    def _get_contextual_values(self, column: str, exclude_ids: List[int], count: int) -> Dict[int, List[str]]:
+        """Lấy giá trị (word hoặc meaning) contextual cho nhiều flashcard
+        
+        Mỗi id ưu tiên các từ trong khoảng 10 ID trước/sau của chính nó (range scan trên primary key,
+        JOIN với json_each), chỉ id nào không đủ mới bổ sung ngẫu nhiên từ phần còn lại của database.
+        Các giá trị trong khoảng được cache theo get_flashcards_table_version, nên các phiên review
+        sau chỉ query những id chưa gặp (mỗi lần vẫn bốc ngẫu nhiên từ cache).
+        """
+        if column not in ("word", "meaning"):
+            raise ValueError(f"Invalid contextual column: {column}")
+        
+        values_by_id = {exclude_id: [] for exclude_id in exclude_ids}
+        if not values_by_id:
+            return values_by_id
+        
+        with self._conn() as conn:
+            cursor = conn.cursor()
             
-            # Nếu vẫn không đủ, thêm words mặc định
-            default_words = [
-                "apple", "book", "cat", "dog", "elephant", 
-                "flower", "guitar", "house", "computer", "phone",
-                "chair", "table", "water", "coffee", "music",
-                "movie", "garden", "window", "door", "street"
-            ]
+            # Bảng thay đổi -> bỏ toàn bộ cache (thay cả dict để thread khác không thấy cache dở dang)
+            version = self.get_flashcards_table_version(cursor)
+            if self._contextual_cache["version"] != version:
+                self._contextual_cache = {"version": version, "word": {}, "meaning": {}}
+            window_cache = self._contextual_cache[column]
             
-            # Bổ sung words mặc định nếu cần
-            for word in default_words:
-                if len(words) >= count:
-                    break
-                if word not in words:
-                    words.append(word)
+            missing_ids = [exclude_id for exclude_id in values_by_id if exclude_id not in window_cache]
+            if missing_ids:
+                cursor.execute(f"""
+                    SELECT t.value, f.{column} FROM json_each(?) AS t
+                    JOIN flashcards AS f
+                      ON f.id BETWEEN MAX(1, t.value - 10) AND t.value + 10 AND f.id != t.value
+                """, (json.dumps(missing_ids),))
+                
+                # Bỏ trùng lặp trong từng flashcard
+                windows = {exclude_id: {} for exclude_id in missing_ids}
+                for exclude_id, value in cursor:
+                    windows[exclude_id][value] = None
+                for exclude_id, window in windows.items():
+                    window_cache[exclude_id] = tuple(window)
             
-            # Trộn ngẫu nhiên và lấy đúng số lượng cần
-            random.shuffle(words)
-            return words[:count]
+            for exclude_id, values in values_by_id.items():
+                # Thứ tự ngẫu nhiên mỗi lần gọi
+                window = window_cache[exclude_id]
+                values.extend(random.sample(window, min(count, len(window))))
+                
+                # Nếu không đủ, lấy thêm từ database (ngẫu nhiên)
+                if len(values) < count:
+                    low, high = max(1, exclude_id - 10), exclude_id + 10
+                    values.extend(self._sample_random_values(
+                        cursor, column, count - len(values), low, high, values))
+        return values_by_id
+    
+    @staticmethod
+    def _complete_contextual_values(values: List[str], defaults, count: int) -> List[str]:
+        """Bổ sung giá trị mặc định nếu vẫn không đủ, rồi lấy ngẫu nhiên đúng count giá trị"""
+        seen = set(values)
+        for value in defaults:
+            if len(values) >= count:
+                break
+            if value not in seen:
+                values.append(value)
+                seen.add(value)
+        
+        # Lấy ngẫu nhiên đúng số lượng cần (thứ tự ngẫu nhiên)
+        return random.sample(values, min(count, len(values)))
+    
+    def get_contextual_words_for_stage3(self, exclude_id: int, count: int = 3) -> List[str]:
+        """Lấy từ (words) contextual cho Stage 3 multiple choice
+        
+        Logic: Lấy từ 10 ID trước và 10 ID sau (tổng 20 từ) để gợi nhớ các từ đã học cùng thời điểm
+        Nếu không đủ thì bổ sung từ danh sách mặc định
+        """
+        return self.get_contextual_words_for_stage3_batch([exclude_id], count)
+    
+    def get_contextual_words_for_stage3_batch(self, exclude_ids: List[int], count: int = 3) -> List[str]:
+        """Như get_contextual_words_for_stage3 cho cả phiên review trong một câu SQL
+        
+        Trả về danh sách gộp count từ của từng flashcard (có thể trùng giữa các flashcard)
+        """
+        values_by_id = self._get_contextual_values("word", exclude_ids, count)
+        words = []
+        for values in values_by_id.values():
+            words.extend(self._complete_contextual_values(values, _DEFAULT_WORDS, count))
+        return words
     
     def get_contextual_meanings_for_stage2(self, exclude_id: int, count: int = 3) -> List[str]:
         """Lấy nghĩa (meanings) contextual cho Stage 2 multiple choice
@@ -337,70 +643,18 @@ class DatabaseManager:
         Logic: Lấy từ 10 ID trước và 10 ID sau (tổng 20 từ) để gợi nhớ các từ đã học cùng thời điểm
         Nếu không đủ thì bổ sung từ danh sách mặc định
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Lấy meanings từ 10 ID trước và 10 ID sau
-            cursor.execute("""
-                SELECT meaning FROM flashcards 
-                WHERE id != ? AND (
-                    (id >= ? AND id <= ?) OR  -- 10 ID trước
-                    (id >= ? AND id <= ?)     -- 10 ID sau
-                )
-                ORDER BY id
-            """, (exclude_id, max(1, exclude_id - 10), exclude_id - 1, 
-                  exclude_id + 1, exclude_id + 10))
-            
-            results = cursor.fetchall()
-            meanings = [row[0] for row in results]
-            
-            # Nếu không đủ từ, lấy thêm từ database (ngẫu nhiên)
-            if len(meanings) < count:
-                cursor.execute("""
-                    SELECT meaning FROM flashcards 
-                    WHERE id != ? AND meaning NOT IN ({})
-                    ORDER BY RANDOM() 
-                    LIMIT ?
-                """.format(','.join(['?'] * len(meanings))), 
-                [exclude_id] + meanings + [count - len(meanings)])
-                
-                additional_results = cursor.fetchall()
-                meanings.extend([row[0] for row in additional_results])
-            
-            # Nếu vẫn không đủ, thêm meanings mặc định
-            default_meanings = [
-                "a red fruit that grows on trees",
-                "an object with pages for reading", 
-                "a small animal that says meow",
-                "a loyal pet animal",
-                "a large gray animal with a trunk",
-                "a colorful plant that blooms",
-                "a musical instrument with strings",
-                "a building where people live",
-                "a yellow fruit that monkeys like",
-                "a vehicle with four wheels",
-                "a device for communication",
-                "a piece of furniture for sitting",
-                "a liquid that falls from the sky",
-                "a bright object in the sky",
-                "a green plant that grows in lawns",
-                "a tool for writing",
-                "a container for drinking",
-                "a place where people work",
-                "a time when the sun sets",
-                "a feeling of happiness"
-            ]
-            
-            # Bổ sung meanings mặc định nếu cần
-            for meaning in default_meanings:
-                if len(meanings) >= count:
-                    break
-                if meaning not in meanings:
-                    meanings.append(meaning)
-            
-            # Trộn ngẫu nhiên và lấy đúng số lượng cần
-            random.shuffle(meanings)
-            return meanings[:count]
+        return self.get_contextual_meanings_for_stage2_batch([exclude_id], count)
+    
+    def get_contextual_meanings_for_stage2_batch(self, exclude_ids: List[int], count: int = 3) -> List[str]:
+        """Như get_contextual_meanings_for_stage2 cho cả phiên review trong một câu SQL
+        
+        Trả về danh sách gộp count nghĩa của từng flashcard (có thể trùng giữa các flashcard)
+        """
+        values_by_id = self._get_contextual_values("meaning", exclude_ids, count)
+        meanings = []
+        for values in values_by_id.values():
+            meanings.extend(self._complete_contextual_values(values, _DEFAULT_MEANINGS, count))
+        return meanings
     
     def _calculate_next_interval(self, flashcard: FlashCard, result: str) -> float:
         """Thuật toán 2: Tính interval cho lần ôn tập tiếp theo"""
@@ -438,9 +692,9 @@ class DatabaseManager:
             # Fallback cho các result khác
             return base_interval
     
-    def _calculate_priority_score(self, flashcard: FlashCard) -> float:
-        """Thuật toán 1: Tính điểm ưu tiên"""
-        current_time = datetime.now()
+    def _calculate_priority_score(self, flashcard: FlashCard, now: Optional[float] = None) -> float:
+        """Thuật toán 1: Tính điểm ưu tiên (now: thời điểm tính, mặc định là hiện tại)"""
+        current_time = time.time() if now is None else now
         
         # Điểm cơ bản theo stage
         stage_priority = {1: 100, 2: 80, 3: 60, 4: 40, 5: 20}
@@ -448,18 +702,9 @@ class DatabaseManager:
         
         # Điểm thưởng cho từ vựng quá hạn
         overdue_bonus = 0
-        if flashcard.next_review_time:
-            if isinstance(flashcard.next_review_time, str):
-                try:
-                    next_review = datetime.fromisoformat(flashcard.next_review_time.replace('Z', '+00:00'))
-                except ValueError:
-                    next_review = datetime.strptime(flashcard.next_review_time, '%Y-%m-%d %H:%M:%S')
-            else:
-                next_review = flashcard.next_review_time
-            
-            if next_review <= current_time:
-                overdue_hours = (current_time - next_review).total_seconds() / 3600
-                overdue_bonus = min(overdue_hours * 5, 50)
+        if flashcard.next_review_time and flashcard.next_review_time <= current_time:
+            overdue_hours = (current_time - flashcard.next_review_time) / 3600
+            overdue_bonus = min(overdue_hours * 5, 50)
         
         # Điểm thưởng cho từ vựng sai gần đây
         wrong_penalty = 30 if flashcard.correct == False else 0
@@ -469,50 +714,22 @@ class DatabaseManager:
         
         return base_score + overdue_bonus + wrong_penalty + creation_bonus
     
-    def _update_priority_score(self, flashcard_id: int):
-        """Cập nhật priority_score cho một flashcard"""
-        flashcard = self.get_flashcard_by_id(flashcard_id)
-        if flashcard:
-            new_score = self._calculate_priority_score(flashcard)
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("UPDATE flashcards SET priority_score = ? WHERE id = ?", 
-                             (new_score, flashcard_id))
-                conn.commit()
-    
     def _update_all_priority_scores(self):
-        """Cập nhật priority_score cho tất cả flashcard"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM flashcards")
-            rows = cursor.fetchall()
-            
-            for row in rows:
-                flashcard = self._row_to_flashcard(row)
-                new_score = self._calculate_priority_score(flashcard)
-                cursor.execute("UPDATE flashcards SET priority_score = ? WHERE id = ?", 
-                             (new_score, flashcard.id))
-            conn.commit()
+        """Cập nhật priority_score cho tất cả flashcard
+        
+        Cùng công thức với _calculate_priority_score nhưng chạy bằng một câu UPDATE duy nhất.
+        Chỉ ghi các dòng có điểm thay đổi (đa số từ chưa due giữ nguyên điểm) để không ghi lại page vào WAL
+        """
+        with self._conn(write=True) as conn:
+            cursor = conn.execute(f"""
+                UPDATE flashcards SET priority_score = {self.PRIORITY_SCORE_SQL}
+                WHERE priority_score IS NOT {self.PRIORITY_SCORE_SQL}
+            """, {"now": int(time.time())})
+            return cursor.rowcount
     
     def _row_to_flashcard(self, row) -> FlashCard:
-        """Chuyển row database thành FlashCard object"""
-        return FlashCard(
-            id=row[0],
-            word=row[1], 
-            meaning=row[2],
-            example=row[3],
-            tag=row[4],
-            stage_id=row[5],
-            correct=row[6],
-            created_at=row[7],
-            last_reviewed_at=row[8],
-            next_review_time=row[9],
-            review_count=row[10],
-            correct_count=row[11],
-            wrong_count=row[12],
-            priority_score=row[13],
-            interval_hours=row[14]
-        )
+        """Chuyển row database (sqlite3.Row) thành FlashCard object"""
+        return FlashCard.from_row(row)
     
     # Thuật toán 1: Tính độ ưu tiên (đơn giản)
     def calculate_priority_flashcards(self, limit: int = 5) -> List[FlashCard]:
@@ -522,14 +739,15 @@ class DatabaseManager:
     # Thuật toán 2: Tính interval test tiếp theo (đơn giản)  
     def calculate_next_test_interval(self) -> int:
         """Tính khoảng cách phiên test tiếp theo (phút)"""
-        with sqlite3.connect(self.db_path) as conn:
+        now = int(time.time())
+        with self._conn() as conn:
             cursor = conn.cursor()
             
             # Đếm số từ due hiện tại
             cursor.execute("""
                 SELECT COUNT(*) FROM flashcards 
                 WHERE next_review_time <= ?
-            """, (datetime.now(),))
+            """, (now,))
             due_count = cursor.fetchone()[0]
             
             if due_count == 0:
@@ -537,13 +755,12 @@ class DatabaseManager:
                 cursor.execute("""
                     SELECT MIN(next_review_time) FROM flashcards 
                     WHERE next_review_time > ?
-                """, (datetime.now(),))
+                """, (now,))
                 next_due_time = cursor.fetchone()[0]
                 
                 if next_due_time:
                     # Tính thời gian đến từ sắp due sớm nhất
-                    next_due = datetime.fromisoformat(next_due_time.replace('Z', '+00:00')) if isinstance(next_due_time, str) else next_due_time
-                    minutes_until_next = max(5, int((next_due - datetime.now()).total_seconds() / 60))
+                    minutes_until_next = max(5, (next_due_time - now) // 60)
                     return min(minutes_until_next, 30)  # Tối đa 1 giờ
                 else:
                     return 5  # Default 30 phút nếu không có từ nào
@@ -554,8 +771,8 @@ class DatabaseManager:
     
     def get_flashcard_by_id(self, flashcard_id: int) -> Optional[FlashCard]:
         """Lấy flashcard theo ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM flashcards WHERE id = ?", (flashcard_id,))
             row = cursor.fetchone()
-            return self._row_to_flashcard(row) if row else None
\ No newline at end of file
+            return FlashCard.from_row(row) if row else None
\ No newline at end of file
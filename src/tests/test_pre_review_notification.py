@@ -6,6 +6,7 @@ Tests both the standalone notification and integrated workflow
 
 import sys
 import sqlite3
+import time
 from datetime import datetime
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QLabel
 from PyQt5.QtCore import Qt, QTimer
@@ -122,7 +123,7 @@ Instructions:
                         UPDATE flashcards 
                         SET next_review_time = ? 
                         WHERE next_review_time > ?
-                    """, (datetime.now(), datetime.now()))
+                    """, (int(time.time()), int(time.time())))
                     conn.commit()
                     
                     self.update_status(f"Created {len(test_cards)} test flashcards", "blue")
@@ -180,7 +181,7 @@ Instructions:
             # Temporarily set all flashcards to future review time
             with sqlite3.connect(self.db_manager.db_path) as conn:
                 cursor = conn.cursor()
-                future_time = datetime.now().replace(hour=23, minute=59)
+                future_time = int(datetime.now().replace(hour=23, minute=59).timestamp())
                 cursor.execute("UPDATE flashcards SET next_review_time = ?", (future_time,))
                 conn.commit()
             
@@ -195,7 +196,7 @@ Instructions:
             # Reset flashcards to be due again
             with sqlite3.connect(self.db_manager.db_path) as conn:
                 cursor = conn.cursor()
-                cursor.execute("UPDATE flashcards SET next_review_time = ?", (datetime.now(),))
+                cursor.execute("UPDATE flashcards SET next_review_time = ?", (int(time.time()),))
                 conn.commit()
                 
         except Exception as e:
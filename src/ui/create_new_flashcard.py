@@ -1,38 +1,164 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, 
-                             QTextEdit, QPushButton, QLabel, QFrame, QMessageBox, QApplication)
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont, QPalette, QColor
+                             QPlainTextEdit, QPushButton, QLabel, QFrame, QMessageBox, QApplication,
+                             QShortcut)
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QRunnable, QThreadPool, QEvent
+from PyQt5.QtGui import QFont, QPalette, QColor, QKeySequence
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# No JIT compilation (e.g. Numba @njit) here: this window is bound by Qt event
+# dispatch, styling and a single SQLite insert, not by numeric loops.
+
+class _SaveFlashcardTask(QRunnable):
+    """Insert a flashcard on a pool thread and report back through signals"""
+    
+    def __init__(self, database_manager, flashcard_data, saved_signal, failed_signal):
+        super().__init__()
+        self.database_manager = database_manager
+        self.flashcard_data = flashcard_data
+        self.saved_signal = saved_signal
+        self.failed_signal = failed_signal
+    
+    def run(self):
+        try:
+            flashcard_id = self.database_manager.create_flashcard(self.flashcard_data)
+        except Exception as e:
+            logger.error(f"Error saving flashcard: {e}")
+            self.failed_signal.emit(str(e))
+            return
+        self.saved_signal.emit(flashcard_id or 0)
+
 class CreateNewFlashcard(QWidget):
     closed = pyqtSignal()
+    saved = pyqtSignal(int)  # Emitted (queued) with the new flashcard id, 0 on failure
+    save_failed = pyqtSignal(str)
+    
+    # Single stylesheet for the whole window (modal_style.html color scheme),
+    # parsed once instead of once per widget. Colors are the opaque
+    # equivalents of the modal_style.html rgba values so the window can be
+    # painted without alpha blending.
+    _QSS = """
+        QWidget#root {
+            background-color: #575757;
+        }
+        QWidget#container {
+            background-color: #575757;
+            border: 1px solid #444444;
+            border-radius: 8px;
+        }
+        QLabel {
+            color: #B0B0B0;
+            background-color: transparent;
+            border: none;
+            outline: none;
+        }
+        QLabel#title {
+            color: #FFFFFF;
+            margin-bottom: 10px;
+        }
+        QLabel#status {
+            font-size: 10px;
+        }
+        QLineEdit, QPlainTextEdit {
+            background-color: #353535;
+            color: #E0E0E0;
+            border: 1px solid #444444;
+            border-radius: 4px;
+            padding: 8px;
+            font-size: 11px;
+        }
+        QLineEdit:focus, QPlainTextEdit:focus {
+            border: 1px solid #888888;
+            background-color: #272727;
+        }
+        QPushButton {
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: bold;
+            font-size: 11px;
+        }
+        QPushButton#save {
+            background-color: #888888;
+            color: #ffffff;
+        }
+        QPushButton#save:hover {
+            background-color: #999999;
+        }
+        QPushButton#save:pressed {
+            background-color: #777777;
+        }
+        QPushButton#save:disabled {
+            background-color: #474747;
+            color: #B0B0B0;
+        }
+        QPushButton#clear {
+            background-color: #E0E0E0;
+            color: #121212;
+        }
+        QPushButton#clear:hover {
+            background-color: #F0F0F0;
+        }
+        QPushButton#clear:pressed {
+            background-color: #D0D0D0;
+        }
+        QPushButton#close {
+            background-color: #B0B0B0;
+            color: #121212;
+        }
+        QPushButton#close:hover {
+            background-color: #C0C0C0;
+        }
+        QPushButton#close:pressed {
+            background-color: #A0A0A0;
+        }
+    """
+    
+    # (label, attribute, widget class, placeholder, max height) per input row
+    _FIELDS = (
+        ("Word:", "word_input", QLineEdit, "Enter the word...", None),
+        ("Meaning:", "meaning_input", QPlainTextEdit, "Enter the meaning...", 60),
+        ("Example (optional):", "example_input", QPlainTextEdit, "Enter an example sentence...", 45),
+        ("Tags (comma separated):", "tag_input", QLineEdit, "e.g., noun, business, advanced", None),
+    )
+    
+    _READY_STATUS = "📖 Ready to create flashcard"
+    
+    # Fonts and screen geometry shared by every instance, created on first use
+    _TITLE_FONT = None
+    _LABEL_FONT = None
+    _SCREEN_GEOM = None
     
     def __init__(self, database_manager):
         super().__init__()
+        cls = type(self)
+        if cls._TITLE_FONT is None:
+            cls._TITLE_FONT = QFont("Arial", 14, QFont.Bold)
+            cls._LABEL_FONT = QFont("Arial", 10, QFont.Bold)
         self.database_manager = database_manager
+        self._save_in_progress = False
+        self.saved.connect(self.on_flashcard_saved, Qt.QueuedConnection)
+        self.save_failed.connect(self.on_save_failed, Qt.QueuedConnection)
         self.setup_ui()
         self.setup_window_properties()
         self.setup_shortcuts()
+        self.setup_validation()
         
     def setup_ui(self):
-        """Setup the user interface with semi-transparent container"""
+        """Setup the user interface with an opaque container"""
+        self.setUpdatesEnabled(False)
         self.setWindowTitle("📚 Vocabulary Flashcard Creator")
         self.setFixedSize(400, 450)
+        self.setObjectName("root")
         
         # Variables for dragging window
         self.drag_start_position = None
         
         # Create main container widget with modal_style.html color scheme
         self.container = QWidget()
-        self.container.setStyleSheet("""
-            QWidget {
-                background-color: rgba(68, 68, 68, 0.75);
-                border: 1px solid #444444;
-                border-radius: 8px;
-            }
-        """)
+        self.container.setObjectName("container")
         
         # Main layout for the window
         window_layout = QVBoxLayout()
@@ -46,182 +172,40 @@ class CreateNewFlashcard(QWidget):
         main_layout.setContentsMargins(15, 15, 15, 15)
         self.container.setLayout(main_layout)
         
-        # Title (draggable area) - modal_style.html color scheme
+        # Title (draggable area)
         title_label = QLabel("📚 Vocabulary Flashcard Creator")
-        title_label.setFont(QFont("Arial", 14, QFont.Bold))
+        title_label.setObjectName("title")
+        title_label.setFont(self._TITLE_FONT)
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("color: #FFFFFF; margin-bottom: 10px; background-color: transparent; border: none;")
         # Make title draggable
-        title_label.mousePressEvent = self.mousePressEvent
-        title_label.mouseMoveEvent = self.mouseMoveEvent
+        self._title_label = title_label
+        title_label.installEventFilter(self)
         main_layout.addWidget(title_label)
         
-        # Word label and input (modal_style.html color scheme)
-        word_label = QLabel("Word:")
-        word_label.setFont(QFont("Arial", 10, QFont.Bold))
-        word_label.setStyleSheet("color: #B0B0B0; background-color: transparent; border: none;")
-        main_layout.addWidget(word_label)
-        
-        self.word_input = QLineEdit()
-        self.word_input.setPlaceholderText("Enter the word...")
-        self.word_input.setStyleSheet("""
-            QLineEdit {
-                background-color: rgba(18, 18, 18, 0.5);
-                color: #E0E0E0;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 11px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #888888;
-                background-color: rgba(18, 18, 18, 0.7);
-            }
-            QLineEdit::placeholder {
-                color: #B0B0B0;
-            }
-        """)
-        main_layout.addWidget(self.word_input)
-        
-        # Meaning label and input
-        meaning_label = QLabel("Meaning:")
-        meaning_label.setFont(QFont("Arial", 10, QFont.Bold))
-        meaning_label.setStyleSheet("color: #B0B0B0; background-color: transparent; border: none;")
-        main_layout.addWidget(meaning_label)
-        
-        self.meaning_input = QTextEdit()
-        self.meaning_input.setMaximumHeight(60)
-        self.meaning_input.setPlaceholderText("Enter the meaning...")
-        self.meaning_input.setStyleSheet("""
-            QTextEdit {
-                background-color: rgba(18, 18, 18, 0.5);
-                color: #E0E0E0;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 11px;
-            }
-            QTextEdit:focus {
-                border: 1px solid #888888;
-                background-color: rgba(18, 18, 18, 0.7);
-            }
-        """)
-        main_layout.addWidget(self.meaning_input)
-        
-        # Example label and input
-        example_label = QLabel("Example (optional):")
-        example_label.setFont(QFont("Arial", 10, QFont.Bold))
-        example_label.setStyleSheet("color: #B0B0B0; background-color: transparent; border: none;")
-        main_layout.addWidget(example_label)
-        
-        self.example_input = QTextEdit()
-        self.example_input.setMaximumHeight(45)
-        self.example_input.setPlaceholderText("Enter an example sentence...")
-        self.example_input.setStyleSheet("""
-            QTextEdit {
-                background-color: rgba(18, 18, 18, 0.5);
-                color: #E0E0E0;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 11px;
-            }
-            QTextEdit:focus {
-                border: 1px solid #888888;
-                background-color: rgba(18, 18, 18, 0.7);
-            }
-        """)
-        main_layout.addWidget(self.example_input)
-        
-        # Tags label and input
-        tags_label = QLabel("Tags (comma separated):")
-        tags_label.setFont(QFont("Arial", 10, QFont.Bold))
-        tags_label.setStyleSheet("color: #B0B0B0; background-color: transparent; border: none;")
-        main_layout.addWidget(tags_label)
-        
-        self.tag_input = QLineEdit()
-        self.tag_input.setPlaceholderText("e.g., noun, business, advanced")
-        self.tag_input.setStyleSheet("""
-            QLineEdit {
-                background-color: rgba(18, 18, 18, 0.5);
-                color: #E0E0E0;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 11px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #888888;
-                background-color: rgba(18, 18, 18, 0.7);
-            }
-            QLineEdit::placeholder {
-                color: #B0B0B0;
-            }
-        """)
-        main_layout.addWidget(self.tag_input)
+        # Label + input rows built from _FIELDS, sharing one label font
+        for label_text, attr, widget_cls, placeholder, max_height in self._FIELDS:
+            label = QLabel(label_text)
+            label.setFont(self._LABEL_FONT)
+            main_layout.addWidget(label)
+            
+            field = widget_cls()
+            field.setPlaceholderText(placeholder)
+            if max_height:
+                field.setMaximumHeight(max_height)
+            setattr(self, attr, field)
+            main_layout.addWidget(field)
         
         # Buttons layout (following Create_flashcard.py style)
         button_layout = QHBoxLayout()
         
-        # Save button (modal_style.html color scheme)
         self.save_button = QPushButton("✓ Save")
-        self.save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #888888;
-                color: #ffffff;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #999999;
-            }
-            QPushButton:pressed {
-                background-color: #777777;
-            }
-        """)
+        self.save_button.setObjectName("save")
         
-        # Clear button (modal_style.html color scheme)
         clear_button = QPushButton("⟳ Clear")
-        clear_button.setStyleSheet("""
-            QPushButton {
-                background-color: #E0E0E0;
-                color: #121212;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #F0F0F0;
-            }
-            QPushButton:pressed {
-                background-color: #D0D0D0;
-            }
-        """)
+        clear_button.setObjectName("clear")
         
-        # Close button (modal_style.html color scheme)
         self.cancel_button = QPushButton("✖ Close")
-        self.cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #B0B0B0;
-                color: #121212;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #C0C0C0;
-            }
-            QPushButton:pressed {
-                background-color: #A0A0A0;
-            }
-        """)
+        self.cancel_button.setObjectName("close")
         
         button_layout.addWidget(self.save_button)
         button_layout.addWidget(clear_button)
@@ -229,20 +213,15 @@ class CreateNewFlashcard(QWidget):
         
         main_layout.addLayout(button_layout)
         
-        # Status label (modal_style.html color scheme)
-        self.status_label = QLabel("📖 Ready to create flashcard")
-        self.status_label.setStyleSheet("color: #B0B0B0; font-size: 10px; background-color: transparent; border: none;")
+        # Status label
+        self.status_label = QLabel(self._READY_STATUS)
+        self.status_label.setObjectName("status")
         self.status_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(self.status_label)
         
-        # Additional styling for clean labels
-        self.setStyleSheet("""
-            QLabel {
-                background: transparent;
-                border: none;
-                outline: none;
-            }
-        """)
+        # Apply the whole stylesheet once, after all children exist
+        self.setStyleSheet(self._QSS)
+        self.setUpdatesEnabled(True)
         
         # Connect signals
         self.save_button.clicked.connect(self.save_flashcard)
@@ -250,57 +229,126 @@ class CreateNewFlashcard(QWidget):
         self.cancel_button.clicked.connect(self.close)
         
     def setup_window_properties(self):
-        """Setup window properties with semi-transparent background"""
-        # Frameless window with transparency support
+        """Setup window properties with an opaque background"""
+        # Frameless window; no WA_TranslucentBackground so repaints and drags
+        # don't need a full alpha composite of the window
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        
-        # Set window background color to match modal_style.html
-        self.setStyleSheet("background-color: #676767;")
         
         # Make window draggable
         self.mouse_pressed = False
         self.mouse_position = None
         
+        # Move events arriving within the same event-loop tick collapse into
+        # a single move() so dragging doesn't hit the window manager per pixel
+        self._pending_move = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(0)
+        self._move_timer.timeout.connect(self._flush_move)
+        
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
+        # Esc / Ctrl+Space close the window; matched by Qt, not a Python key handler
+        QShortcut(QKeySequence(Qt.Key_Escape), self, activated=self.close)
+        QShortcut(QKeySequence("Ctrl+Space"), self, activated=self.close)
+        
+        # Enter saves from the single-line fields; the multi-line fields keep
+        # Enter for new lines as before
+        self.word_input.returnPressed.connect(self._on_enter_pressed)
+        self.tag_input.returnPressed.connect(self._on_enter_pressed)
+        
         # Auto-focus on word field when opened
         self.word_input.setFocus()
+    
+    def setup_validation(self):
+        """Debounce form validation so it runs once per ~150ms of idle typing"""
+        self._pending_save = False
+        self.save_button.setEnabled(False)
+        
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(self._do_validate)
+        
+        self.word_input.textChanged.connect(self._schedule_validate)
+        self.meaning_input.textChanged.connect(self._schedule_validate)
+        
+    def _schedule_validate(self, *args):
+        """Restart the debounce timer on every keystroke"""
+        self._validate_timer.start()
+    
+    def _do_validate(self):
+        """Validate required fields after typing settles, then run any deferred save"""
+        word = self.word_input.text().strip()
+        meaning = self.meaning_input.toPlainText().strip()
+        self.save_button.setEnabled(bool(word and meaning))
         
-    def mousePressEvent(self, event):
-        """Handle mouse press for dragging"""
+        if self._pending_save:
+            self._pending_save = False
+            self.save_flashcard()
+        
+    def eventFilter(self, obj, event):
+        """Forward title label mouse events to the window drag handlers"""
+        if obj is self._title_label:
+            event_type = event.type()
+            if event_type == QEvent.MouseButtonPress:
+                self._begin_drag(event)
+                return True
+            elif event_type == QEvent.MouseMove:
+                self._drag(event)
+                return True
+        return super().eventFilter(obj, event)
+    
+    def _begin_drag(self, event):
+        """Remember the cursor offset from the window corner"""
         if event.button() == Qt.LeftButton:
             self.mouse_pressed = True
             self.mouse_position = event.globalPos() - self.frameGeometry().topLeft()
             event.accept()
     
-    def mouseMoveEvent(self, event):
-        """Handle mouse move for dragging"""
+    def _drag(self, event):
+        """Move the window along with the cursor"""
         if self.mouse_pressed and self.mouse_position:
-            self.move(event.globalPos() - self.mouse_position)
+            self._pending_move = event.globalPos() - self.mouse_position
+            if not self._move_timer.isActive():
+                self._move_timer.start()
             event.accept()
     
+    def _flush_move(self):
+        """Apply the latest queued drag position"""
+        new_pos = self._pending_move
+        self._pending_move = None
+        if new_pos is not None and new_pos != self.pos():
+            self.move(new_pos)
+    
+    def mousePressEvent(self, event):
+        """Handle mouse press for dragging"""
+        self._begin_drag(event)
+    
+    def mouseMoveEvent(self, event):
+        """Handle mouse move for dragging"""
+        self._drag(event)
+    
     def mouseReleaseEvent(self, event):
         """Handle mouse release"""
+        self._move_timer.stop()
+        self._flush_move()
         self.mouse_pressed = False
         self.mouse_position = None
         event.accept()
     
-    def keyPressEvent(self, event):
-        """Handle keyboard shortcuts"""
-        if event.key() == Qt.Key_Return or event.key() == Qt.Key_Enter:
-            self.save_flashcard()
-        elif event.key() == Qt.Key_Escape:
-            self.close()
-        elif event.modifiers() == Qt.ControlModifier and event.key() == Qt.Key_Space:
-            self.close()
+    def _on_enter_pressed(self):
+        """Save on Enter"""
+        # Coalesce rapid Enter presses while the debounce is still pending
+        if self._validate_timer.isActive():
+            self._pending_save = True
         else:
-            super().keyPressEvent(event)
+            self.save_flashcard()
     
     def validate_form(self):
         """Validate form fields"""
         word = self.word_input.text().strip()
-        meaning = self.meaning_input.text().strip()
+        meaning = self.meaning_input.toPlainText().strip()
         
         if not word:
             QMessageBox.warning(self, "Validation Error", "Word field is required!")
@@ -322,52 +370,74 @@ class CreateNewFlashcard(QWidget):
         self.tag_input.clear()
         self.word_input.setFocus()
     
+    def reset_form(self):
+        """Return the window to its initial state so it can be reused for the next open"""
+        self._pending_save = False
+        self.clear_inputs()
+        self.status_label.setText(self._READY_STATUS)
+    
     def save_flashcard(self):
         """Save flashcard to database (following Create_flashcard.py style)"""
+        # Ignore repeated saves while the previous insert is still running
+        if self._save_in_progress:
+            return
+        
         try:
             word = self.word_input.text().strip()
             meaning = self.meaning_input.toPlainText().strip()
             example = self.example_input.toPlainText().strip()
-            tags = self.tag_input.text().strip()
+            tags = self.tag_input.text()
             
             if not word or not meaning:
                 QMessageBox.warning(self, "Warning", "Please fill in both Word and Meaning fields!")
                 return
             
-            # Process tags
-            tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()] if tags else []
+            # Process tags in a single pass (one strip per tag)
+            tag_list = [tag for tag in (part.strip() for part in tags.split(',')) if tag]
             
             # Create flashcard data
             flashcard_data = {
                 'word': word,
                 'meaning': meaning,
                 'example': example,
-                'tag': ', '.join(tag_list) if tag_list else ''
+                'tag': ', '.join(tag_list)
             }
             
-            # Save to database
-            flashcard_id = self.database_manager.create_flashcard(flashcard_data)
-            
-            if flashcard_id:
-                logger.info(f"Flashcard created successfully with ID: {flashcard_id}")
-                
-                # Clear inputs
-                self.clear_inputs()
-                
-                # Update status with success message
-                from datetime import datetime
-                self.status_label.setText(f"📖 Flashcard saved! (Last: {datetime.now().strftime('%H:%M:%S')})")
-                
-                # Focus back to word input
-                self.word_input.setFocus()
-                
-            else:
-                QMessageBox.critical(self, "Error", "Failed to create flashcard!")
+            # Save to database on a pool thread so disk I/O never blocks the UI
+            self._save_in_progress = True
+            QThreadPool.globalInstance().start(
+                _SaveFlashcardTask(self.database_manager, flashcard_data, self.saved, self.save_failed)
+            )
                 
         except Exception as e:
             logger.error(f"Error saving flashcard: {e}")
             QMessageBox.critical(self, "Error", f"Failed to save flashcard: {str(e)}")
     
+    def on_flashcard_saved(self, flashcard_id):
+        """Handle the result of a background flashcard insert"""
+        self._save_in_progress = False
+        
+        if flashcard_id:
+            logger.info("Flashcard created successfully with ID: %s", flashcard_id)
+            
+            # Clear inputs
+            self.clear_inputs()
+            
+            # Update status with success message
+            saved_at = time.strftime('%H:%M:%S')
+            self.status_label.setText(f"📖 Flashcard saved! (Last: {saved_at})")
+            
+            # Focus back to word input
+            self.word_input.setFocus()
+            
+        else:
+            QMessageBox.critical(self, "Error", "Failed to create flashcard!")
+    
+    def on_save_failed(self, message):
+        """Handle an exception raised by a background flashcard insert"""
+        self._save_in_progress = False
+        QMessageBox.critical(self, "Error", f"Failed to save flashcard: {message}")
+    
     def show(self):
         """Show the flashcard window (following Create_flashcard.py style)"""
         super().show()
@@ -375,7 +445,10 @@ class CreateNewFlashcard(QWidget):
         self.activateWindow()
         
         # Center window on screen (like Create_flashcard.py)
-        screen = QApplication.desktop().screenGeometry()
+        cls = type(self)
+        if cls._SCREEN_GEOM is None:
+            cls._SCREEN_GEOM = QApplication.primaryScreen().geometry()
+        screen = cls._SCREEN_GEOM
         window = self.geometry()
         x = (screen.width() - window.width()) // 2
         y = (screen.height() - window.height()) // 2
@@ -1,8 +1,10 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, 
-                             QLabel, QPushButton, QFrame, QTextEdit)
+                             QLabel, QPushButton, QFrame, QTextEdit, QStackedWidget, QApplication)
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QPalette, QColor
-from typing import List, Dict
+from typing import List, Dict, Optional
+from enum import IntEnum
+from functools import partial
 import logging
 import random
 
@@ -10,53 +12,216 @@ from src.database.database_manager import FlashCard
 
 logger = logging.getLogger(__name__)
 
+# Fallback multiple choice options when the contextual pools are too small
+_DEFAULT_MEANINGS = (
+    "a common example word",
+    "a test meaning for practice",
+    "a sample definition",
+    "a demonstration phrase",
+    "a placeholder meaning",
+)
+_DEFAULT_WORDS = ("example", "test", "word", "sample", "demo")
+
+# Letter prefixes of the 4 multiple choice buttons
+_MC_PREFIXES = ("A. ", "B. ", "C. ", "D. ")
+
+# Stylesheets are parsed once per window through object name selectors
+_CONTAINER_QSS = """
+    ReviewerModule {
+        background-color: #676767;
+    }
+    QWidget#reviewContainer {
+        background-color: rgba(68, 68, 68, 0.75);
+        border: 1px solid #444444;
+        border-radius: 8px;
+    }
+    QLabel {
+        background-color: transparent;
+        border: none;
+    }
+    QLabel#progressLabel { color: #B0B0B0; font-size: 12px; font-weight: bold; }
+    QLabel#timerLabel { color: #E0E0E0; font-size: 12px; font-weight: bold; }
+"""
+
+_LABEL_WORD_QSS = """
+    QLabel#titleLabel { font-size: 14px; font-weight: bold; color: #FFD700; margin: 5px; }
+    QLabel#infoWordLabel { font-size: 24px; font-weight: bold; color: #FFFFFF; margin: 10px; }
+    QLabel#revealWordLabel { font-size: 18px; font-weight: bold; color: #FFFFFF; margin: 5px; }
+    QLabel#choiceWordLabel { font-size: 20px; font-weight: bold; color: #FFFFFF; margin: 10px; }
+    QLabel#hintLabel { font-size: 14px; color: #FFD700; margin: 5px; font-family: monospace; }
+"""
+
+_LABEL_MEANING_QSS = """
+    QLabel#successIcon { font-size: 30px; color: #4CAF50; margin: 5px; }
+    QLabel#revealMeaningLabel { font-size: 16px; font-weight: bold; color: #FFFFFF; margin: 10px; }
+    QLabel#meaningLabel { font-size: 16px; color: #FFFFFF; margin: 10px; }
+"""
+
+_LABEL_EXAMPLE_QSS = """
+    QLabel#infoExampleLabel { font-size: 12px; color: #B0B0B0; margin: 8px; font-style: italic; }
+    QLabel#revealExampleLabel { font-size: 11px; color: #B0B0B0; margin: 5px; font-style: italic; }
+    QLabel#exampleLabel { font-size: 12px; color: #B0B0B0; margin: 5px; font-style: italic; }
+    QLabel#tagLabel { font-size: 10px; color: #B0B0B0; margin: 5px; }
+"""
+
+_LABEL_RESULT_QSS = """
+    QLabel#feedbackIcon { font-size: 40px; margin: 10px; }
+    QLabel#feedbackText { font-size: 16px; font-weight: bold; margin: 5px; }
+    QLabel#feedbackIcon[result="True"], QLabel#feedbackText[result="True"] { color: #00CC00; }
+    QLabel#feedbackIcon[result="False"], QLabel#feedbackText[result="False"] { color: #CC0000; }
+    QLabel#correctLabel { font-size: 12px; color: #E0E0E0; margin: 5px; }
+    QLabel#summaryEmoji { font-size: 50px; margin: 10px; }
+    QLabel#summaryMessage { font-size: 18px; font-weight: bold; margin: 5px; }
+    QLabel#summaryMessage[tone="excellent"] { color: #FFD700; }
+    QLabel#summaryMessage[tone="great"] { color: #00CC00; }
+    QLabel#summaryMessage[tone="good"] { color: #FFA500; }
+    QLabel#summaryMessage[tone="practice"] { color: #FF6600; }
+    QLabel#summaryMessage[tone="paused"] { color: #FFA500; }
+    QLabel#summaryDetail { font-size: 14px; color: #E0E0E0; margin: 5px; }
+    QLabel#summaryStats { font-size: 12px; color: #B0B0B0; margin: 5px; }
+"""
+
+_BTN_GOT_IT_QSS = """
+    QPushButton#gotItButton {
+        background-color: #4CAF50;
+        color: #ffffff;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 6px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton#gotItButton:hover {
+        background-color: #5CBF60;
+    }
+    QPushButton#gotItButton:pressed {
+        background-color: #3CAF40;
+    }
+"""
+
+_BTN_LIGHT_QSS = """
+    QPushButton#mcOption {
+        background-color: #E0E0E0;
+        color: #121212;
+        border: none;
+        padding: 6px 8px;
+        border-radius: 4px;
+        font-weight: normal;
+        font-size: 12px;
+        text-align: left;
+        margin: 0px;
+        min-height: 25px;
+        max-height: 35px;
+    }
+    QPushButton#mcOption:hover {
+        background-color: #F0F0F0;
+    }
+    QPushButton#mcOption:pressed {
+        background-color: #D0D0D0;
+    }
+"""
+
+_BTN_DARK_QSS = """
+    QPushButton#submitButton {
+        background-color: #888888;
+        color: #ffffff;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QPushButton#submitButton:hover {
+        background-color: #999999;
+    }
+    QPushButton#submitButton:pressed {
+        background-color: #777777;
+    }
+"""
+
+_INPUT_QSS = """
+    QLineEdit#answerInput {
+        background-color: rgba(18, 18, 18, 0.5);
+        color: #E0E0E0;
+        border: 1px solid #444444;
+        border-radius: 4px;
+        padding: 8px;
+        font-size: 11px;
+    }
+    QLineEdit#answerInput:focus {
+        border: 1px solid #888888;
+        background-color: rgba(18, 18, 18, 0.7);
+    }
+    QLineEdit#answerInput::placeholder {
+        color: #B0B0B0;
+    }
+"""
+
+_GLOBAL_QSS = (_CONTAINER_QSS + _LABEL_WORD_QSS + _LABEL_MEANING_QSS + _LABEL_EXAMPLE_QSS +
+               _LABEL_RESULT_QSS + _BTN_GOT_IT_QSS + _BTN_LIGHT_QSS + _BTN_DARK_QSS + _INPUT_QSS)
+
+class ReviewPhase(IntEnum):
+    """What the reviewer's single phase timer fires into"""
+    REVIEWING = 0  # Auto-close countdown of the current flashcard
+    REVEAL = 1     # Stage 1 meaning reveal (2s)
+    FEEDBACK = 2   # Correct/incorrect feedback (1s)
+    SUMMARY = 3    # Summary or timeout message (3s)
+
 class ReviewerModule(QWidget):
     review_completed = pyqtSignal(dict)  # {flashcard_id: result}
     
+    # Primary screen width shared by every reviewer window, kept current by the screen signals
+    _screen_width = None
+    
     def __init__(self):
         super().__init__()
         self.current_flashcards = []
         self.current_index = 0
-        self.results = {}
+        self.card_results = []  # Result per position in current_flashcards, None until answered
+        self.results_emitted = False  # review_completed fires once per session
         self.timeout_seconds = 10
         self.contextual_words = []
         self.contextual_meanings = []
+        self.contextual_word_set = set()
+        self.contextual_meaning_set = set()
+        
+        # Options currently shown on the multiple choice buttons
+        self.current_options = []
+        self.current_correct_answer = ""
+        
+        # Input field of the card on screen, None unless a Stage 4/5 card is shown
+        self.answer_input: Optional[QLineEdit] = None
+        
+        # Last height passed to setFixedSize, to skip relayouts when it doesn't change
+        self.modal_height = None
         
         self.setup_ui()
         self.setup_window_properties()
         
-        # Auto-close timer
-        self.auto_close_timer = QTimer()
-        self.auto_close_timer.setSingleShot(True)
-        self.auto_close_timer.timeout.connect(self.handle_timeout)
-        
-        # Countdown timer for display update
-        self.countdown_timer = QTimer()
-        self.countdown_timer.timeout.connect(self.update_countdown_display)
-        self.remaining_seconds = 0
+        # Single timer for auto-close, meaning reveal, feedback and summary, dispatched on self.phase
+        self.phase = ReviewPhase.REVIEWING
+        self.phase_timer = QTimer(self)  # Parented so it is destroyed with the window
+        self.phase_timer.setSingleShot(True)
+        self.phase_timer.setTimerType(Qt.PreciseTimer)  # remainingTime() drives the countdown text
+        self.phase_timer.timeout.connect(self.on_phase_timeout)
         
-        # Stage 1 meaning reveal timer
-        self.meaning_reveal_timer = QTimer()
-        self.meaning_reveal_timer.setSingleShot(True)
-        self.meaning_reveal_timer.timeout.connect(self.advance_to_next_flashcard)
+        # Countdown text is derived from phase_timer, see update_countdown_display
+        self.countdown_tick_pending = False
         
         # Stage 1 state tracking
         self.stage1_showing_meaning = False
         
+        # Keys handled by the modal, anything else goes to QWidget
+        self.key_handlers = {Qt.Key_Escape: self.handle_escape_key}
+        
     def setup_ui(self):
         """Setup the user interface"""
         self.setWindowTitle("Vocabulary Review")
-        self.setFixedSize(380, 320)
+        self.set_modal_height(320)
         
         # Create main container widget with modal_style.html color scheme
         self.container = QWidget()
-        self.container.setStyleSheet("""
-            QWidget {
-                background-color: rgba(68, 68, 68, 0.75);
-                border: 1px solid #444444;
-                border-radius: 8px;
-            }
-        """)
+        self.container.setObjectName("reviewContainer")
         
         # Main layout for the window
         window_layout = QVBoxLayout()
@@ -73,21 +238,147 @@ class ReviewerModule(QWidget):
         # Progress indicator
         self.progress_label = QLabel("")
         self.progress_label.setAlignment(Qt.AlignCenter)
-        self.progress_label.setStyleSheet("color: #B0B0B0; font-size: 12px; font-weight: bold; background-color: transparent; border: none;")
-        
-        # Content area (will be populated dynamically)
-        self.content_widget = QWidget()
-        self.content_layout = QVBoxLayout(self.content_widget)
+        self.progress_label.setObjectName("progressLabel")
+        
+        # Content area: one pre-built page per stage, switched per flashcard
+        self.stack = QStackedWidget()
+        self.info_page = self.create_info_page()
+        self.reveal_page = self.create_reveal_page()
+        self.meaning_choice_page = self.create_meaning_choice_page()
+        self.word_choice_page = self.create_word_choice_page()
+        self.input_page = self.create_input_page()
+        self.feedback_page = self.create_feedback_page()
+        self.summary_page = self.create_summary_page()
         
         # Timer indicator
         self.timer_label = QLabel("")
         self.timer_label.setAlignment(Qt.AlignCenter)
-        self.timer_label.setStyleSheet("color: #E0E0E0; font-size: 12px; font-weight: bold; background-color: transparent; border: none;")
+        self.timer_label.setObjectName("timerLabel")
         
         # Add to main layout
         self.main_layout.addWidget(self.progress_label)
-        self.main_layout.addWidget(self.content_widget)
+        self.main_layout.addWidget(self.stack)
         self.main_layout.addWidget(self.timer_label)
+    
+    def create_label(self, object_name: str, word_wrap: bool = False) -> QLabel:
+        """Create a centered label styled through its object name"""
+        label = QLabel("")
+        label.setAlignment(Qt.AlignCenter)
+        label.setObjectName(object_name)
+        label.setWordWrap(word_wrap)
+        return label
+    
+    def add_page(self, *widgets) -> QWidget:
+        """Add a stack page laying out the given widgets (or layouts) top to bottom"""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        for widget in widgets:
+            if isinstance(widget, QVBoxLayout):
+                layout.addLayout(widget)
+            else:
+                layout.addWidget(widget)
+        self.stack.addWidget(page)
+        return page
+    
+    def create_info_page(self) -> QWidget:
+        """Stage 1 page: word first, 'Got It!' reveals the meaning"""
+        title_label = self.create_label("titleLabel")
+        title_label.setText("📚 What does this word mean?")
+        self.info_word_label = self.create_label("infoWordLabel")
+        self.info_example_label = self.create_label("infoExampleLabel", True)
+        self.info_tag_label = self.create_label("tagLabel")
+        
+        self.stage1_got_it_button = QPushButton("Got It!")
+        self.stage1_got_it_button.setObjectName("gotItButton")
+        self.stage1_got_it_button.clicked.connect(self.handle_stage1_got_it)
+        
+        return self.add_page(self.info_example_label, self.info_tag_label, title_label,
+                             self.info_word_label, self.stage1_got_it_button)
+    
+    def create_reveal_page(self) -> QWidget:
+        """Stage 1 meaning reveal page shown after 'Got It!'"""
+        success_icon = self.create_label("successIcon")
+        success_icon.setText("✓")
+        self.reveal_word_label = self.create_label("revealWordLabel")
+        self.reveal_meaning_label = self.create_label("revealMeaningLabel", True)
+        self.reveal_example_label = self.create_label("revealExampleLabel", True)
+        
+        return self.add_page(self.reveal_example_label, success_icon,
+                             self.reveal_word_label, self.reveal_meaning_label)
+    
+    def create_option_buttons(self):
+        """Create the 4 reusable multiple choice buttons"""
+        button_layout = QVBoxLayout()
+        button_layout.setSpacing(8)  # Tăng spacing từ 3 lên 8
+        
+        buttons = []
+        for i in range(len(_MC_PREFIXES)):
+            button = QPushButton("")
+            button.setObjectName("mcOption")
+            
+            # Set minimum size to ensure text fits
+            button.setMinimumHeight(30)
+            button.setMaximumHeight(40)
+            
+            button.clicked.connect(partial(self.handle_option_clicked, i))
+            button_layout.addWidget(button)
+            buttons.append(button)
+        
+        return button_layout, buttons
+    
+    def create_meaning_choice_page(self) -> QWidget:
+        """Stage 2 page: pick the meaning of the given word"""
+        self.meaning_choice_word_label = self.create_label("choiceWordLabel")
+        self.meaning_choice_example_label = self.create_label("exampleLabel", True)
+        button_layout, self.meaning_choice_buttons = self.create_option_buttons()
+        
+        return self.add_page(self.meaning_choice_example_label, self.meaning_choice_word_label, button_layout)
+    
+    def create_word_choice_page(self) -> QWidget:
+        """Stage 3 page: pick the word for the given meaning"""
+        self.word_choice_meaning_label = self.create_label("meaningLabel", True)
+        button_layout, self.word_choice_buttons = self.create_option_buttons()
+        
+        return self.add_page(self.word_choice_meaning_label, button_layout)
+    
+    def create_input_page(self) -> QWidget:
+        """Stage 4/5 page: type the word for the given meaning (stage 4 shows hints)"""
+        self.input_example_label = self.create_label("exampleLabel", True)
+        self.input_meaning_label = self.create_label("meaningLabel", True)
+        self.hint_label = self.create_label("hintLabel")
+        
+        # Input field
+        self.input_field = QLineEdit()
+        self.input_field.setObjectName("answerInput")
+        
+        # Submit button
+        submit_button = QPushButton("Submit")
+        submit_button.setObjectName("submitButton")
+        
+        # Connect signals
+        submit_button.clicked.connect(self.check_input_answer)
+        self.input_field.returnPressed.connect(self.check_input_answer)
+        
+        return self.add_page(self.input_example_label, self.input_meaning_label, self.hint_label,
+                             self.input_field, submit_button)
+    
+    def create_feedback_page(self) -> QWidget:
+        """Page shown for 1 second after an answer"""
+        self.feedback_icon_label = self.create_label("feedbackIcon")
+        self.feedback_text_label = self.create_label("feedbackText")
+        self.feedback_correct_label = self.create_label("correctLabel", True)
+        
+        return self.add_page(self.feedback_icon_label, self.feedback_text_label, self.feedback_correct_label)
+    
+    def create_summary_page(self) -> QWidget:
+        """End of session page, shared by the summary and the timeout message"""
+        self.summary_emoji_label = self.create_label("summaryEmoji")
+        self.summary_message_label = self.create_label("summaryMessage")
+        self.summary_detail_label = self.create_label("summaryDetail")
+        self.summary_stats_label = self.create_label("summaryStats")
+        
+        return self.add_page(self.summary_emoji_label, self.summary_message_label,
+                             self.summary_detail_label, self.summary_stats_label)
         
     def setup_window_properties(self):
         """Setup window properties according to specifications"""
@@ -95,8 +386,8 @@ class ReviewerModule(QWidget):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
         
-        # Set window background color to match modal_style.html
-        self.setStyleSheet("background-color: #676767;")
+        # Window background and every child widget style, matching modal_style.html
+        self.setStyleSheet(_GLOBAL_QSS)
         
         # Enable key press events
         self.setFocusPolicy(Qt.StrongFocus)
@@ -110,19 +401,28 @@ class ReviewerModule(QWidget):
                 return {}
             
             # Stop any existing timer
-            self.auto_close_timer.stop()
+            self.phase_timer.stop()
             
             # Reset state
             self.current_flashcards = flashcards
             self.current_index = 0
-            self.results = {}
+            self.card_results = [None] * len(flashcards)
+            self.results_emitted = False
             self.stage_timeouts = stage_timeouts or {1: 15, 2: 20, 3: 15, 4: 30}
-            self.contextual_words = contextual_words or []
-            self.contextual_meanings = contextual_meanings or []
+            
+            # Per-card timeout and modal height, computed once for the session
+            self.card_timeouts = [self.stage_timeouts.get(fc.stage_id, 10) for fc in flashcards]
+            self.card_heights = [self.calculate_modal_height(fc) for fc in flashcards]
+            self.correct_answers = [fc.word.strip().casefold() for fc in flashcards]
+            # Dedupe keeping first-seen order (a no-op for the schedule maker's pools);
+            # the sets are only for O(1) answer lookups per card
+            self.contextual_words = list(dict.fromkeys(contextual_words or []))
+            self.contextual_meanings = list(dict.fromkeys(contextual_meanings or []))
+            self.contextual_word_set = set(self.contextual_words)
+            self.contextual_meaning_set = set(self.contextual_meanings)
             
             # Clear any existing input references
-            if hasattr(self, 'answer_input'):
-                delattr(self, 'answer_input')
+            self.answer_input = None
             
             # Position at top-right corner
             self.move(self.get_screen_width() - 420, 50)
@@ -133,22 +433,40 @@ class ReviewerModule(QWidget):
             
             logger.info(f"Started review session with {len(flashcards)} flashcards")
             
-        except Exception as e:
-            logger.error(f"Error starting review: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error starting review")
             return {}
     
-    def get_screen_width(self):
-        """Get screen width for positioning"""
-        try:
-            from PyQt5.QtWidgets import QApplication
-            return QApplication.desktop().screenGeometry().width()
-        except:
-            return 1920  # Default fallback
-    
-    def adjust_modal_size(self, flashcard: FlashCard):
-        """Adjust modal size based on content"""
+    @classmethod
+    def get_screen_width(cls):
+        """Get screen width for positioning, queried once and then updated on screen changes"""
+        if cls._screen_width is None:
+            try:
+                cls.on_primary_screen_changed(QApplication.primaryScreen())
+                QApplication.instance().primaryScreenChanged.connect(cls.on_primary_screen_changed)
+            except Exception:
+                return 1920  # Default fallback
+        return cls._screen_width
+    
+    @classmethod
+    def on_primary_screen_changed(cls, screen):
+        """Track the new primary screen's geometry"""
+        screen.geometryChanged.connect(cls.refresh_screen_width)
+        cls.refresh_screen_width()
+    
+    @classmethod
+    def refresh_screen_width(cls, *args):
+        """Re-read the primary screen width"""
+        cls._screen_width = QApplication.primaryScreen().geometry().width()
+    
+    def set_modal_height(self, height: int):
+        """Resize the modal only when its height actually changes"""
+        if height != self.modal_height:
+            self.setFixedSize(380, height)
+            self.modal_height = height
+    
+    def calculate_modal_height(self, flashcard: FlashCard) -> int:
+        """Modal height needed for the flashcard's content"""
         base_height = 320
         
         # Calculate additional height needed
@@ -164,9 +482,7 @@ class ReviewerModule(QWidget):
         if flashcard.stage_id in [2, 3]:
             extra_height += 20  # Extra space for multiple choice buttons
         
-        # Set new size
-        new_height = base_height + extra_height
-        self.setFixedSize(380, new_height)
+        return base_height + extra_height
     
     def show_current_flashcard(self):
         """Display current flashcard based on its stage"""
@@ -179,14 +495,14 @@ class ReviewerModule(QWidget):
         # Update progress
         self.progress_label.setText(f"Review {self.current_index + 1}/{len(self.current_flashcards)}")
         
-        # Clear previous content
-        self.clear_content()
+        # Only input stages set this again
+        self.answer_input = None
         
         # Get timeout for current stage
-        self.timeout_seconds = self.stage_timeouts.get(flashcard.stage_id, 10)
+        self.timeout_seconds = self.card_timeouts[self.current_index]
         
         # Adjust modal size based on content
-        self.adjust_modal_size(flashcard)
+        self.set_modal_height(self.card_heights[self.current_index])
         
         # Show appropriate test based on stage
         if flashcard.stage_id == 1:
@@ -203,78 +519,27 @@ class ReviewerModule(QWidget):
         # Start auto-close timer
         self.start_timer()
     
-    def clear_content(self):
-        """Clear content area safely"""
-        while self.content_layout.count():
-            child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-            elif child.layout():
-                self.clear_layout(child.layout())
+    def set_optional_text(self, label: QLabel, text: str):
+        """Show label with text, or hide it when there is nothing to show"""
+        label.setText(text)
+        label.setVisible(bool(text))
     
-    def clear_layout(self, layout):
-        """Recursively clear a layout"""
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-            elif child.layout():
-                self.clear_layout(child.layout())
+    def set_style_state(self, widget: QWidget, name: str, value: str):
+        """Set a property used by the stylesheet selectors and re-polish the widget"""
+        if widget.property(name) != value:
+            widget.setProperty(name, value)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
     
     def show_info_display(self, flashcard: FlashCard):
         """Stage 1: Interactive memory test - word first, then meaning reveal"""
         self.stage1_showing_meaning = False
         self.current_stage1_flashcard = flashcard
         
-        # Title with book icon for learning
-        title_label = QLabel("📚 What does this word mean?")
-        title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #FFD700; margin: 5px; background-color: transparent; border: none;")
-        
-        # Word
-        word_label = QLabel(flashcard.word)
-        word_label.setAlignment(Qt.AlignCenter)
-        word_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #FFFFFF; margin: 10px; background-color: transparent; border: none;")
-        
-        # Example (if available)
-        if flashcard.example:
-            example_label = QLabel(f"Example: {flashcard.example}")
-            example_label.setAlignment(Qt.AlignCenter)
-            example_label.setStyleSheet("font-size: 12px; color: #B0B0B0; margin: 8px; font-style: italic; background-color: transparent; border: none;")
-            example_label.setWordWrap(True)
-            self.content_layout.addWidget(example_label)
-        
-        # Tag (if available)
-        if flashcard.tag:
-            tag_label = QLabel(f"#{flashcard.tag}")
-            tag_label.setAlignment(Qt.AlignCenter)
-            tag_label.setStyleSheet("font-size: 10px; color: #B0B0B0; margin: 5px; background-color: transparent; border: none;")
-            self.content_layout.addWidget(tag_label)
-        
-        # Got It button for Stage 1
-        self.stage1_got_it_button = QPushButton("Got It!")
-        self.stage1_got_it_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: #ffffff;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #5CBF60;
-            }
-            QPushButton:pressed {
-                background-color: #3CAF40;
-            }
-        """)
-        self.stage1_got_it_button.clicked.connect(self.handle_stage1_got_it)
-        
-        self.content_layout.addWidget(title_label)
-        self.content_layout.addWidget(word_label)
-        self.content_layout.addWidget(self.stage1_got_it_button)
+        self.info_word_label.setText(flashcard.word)
+        self.set_optional_text(self.info_example_label, f"Example: {flashcard.example}" if flashcard.example else "")
+        self.set_optional_text(self.info_tag_label, f"#{flashcard.tag}" if flashcard.tag else "")
+        self.stack.setCurrentWidget(self.info_page)
         
         # Timeout is already set in show_current_flashcard() based on stage
     
@@ -286,8 +551,7 @@ class ReviewerModule(QWidget):
             return
         
         # Stop the main timer since user clicked Got It
-        self.auto_close_timer.stop()
-        self.countdown_timer.stop()
+        self.phase_timer.stop()
         
         # Show meaning reveal
         self.show_stage1_meaning_reveal()
@@ -297,356 +561,128 @@ class ReviewerModule(QWidget):
         self.stage1_showing_meaning = True
         flashcard = self.current_stage1_flashcard
         
-        # Clear content
-        self.clear_content()
-        
-        # Success icon - green checkmark
-        success_icon = QLabel("✓")
-        success_icon.setAlignment(Qt.AlignCenter)
-        success_icon.setStyleSheet("font-size: 30px; color: #4CAF50; margin: 5px; background-color: transparent; border: none;")
-        
-        # Word (smaller now)
-        word_label = QLabel(flashcard.word)
-        word_label.setAlignment(Qt.AlignCenter)
-        word_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #FFFFFF; margin: 5px; background-color: transparent; border: none;")
-        
-        # Meaning (bright white)
-        meaning_label = QLabel(flashcard.meaning)
-        meaning_label.setAlignment(Qt.AlignCenter)
-        meaning_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #FFFFFF; margin: 10px; background-color: transparent; border: none;")
-        meaning_label.setWordWrap(True)
-        
-        # Example (if available)
-        if flashcard.example:
-            example_label = QLabel(f"Example: {flashcard.example}")
-            example_label.setAlignment(Qt.AlignCenter)
-            example_label.setStyleSheet("font-size: 11px; color: #B0B0B0; margin: 5px; font-style: italic; background-color: transparent; border: none;")
-            example_label.setWordWrap(True)
-            self.content_layout.addWidget(example_label)
-        
-        self.content_layout.addWidget(success_icon)
-        self.content_layout.addWidget(word_label)
-        self.content_layout.addWidget(meaning_label)
+        self.reveal_word_label.setText(flashcard.word)
+        self.reveal_meaning_label.setText(flashcard.meaning)
+        self.set_optional_text(self.reveal_example_label, f"Example: {flashcard.example}" if flashcard.example else "")
+        self.stack.setCurrentWidget(self.reveal_page)
         
         # Hide timer during reveal
         self.timer_label.setText("")
         
         # Start 2-second auto-advance timer
-        self.meaning_reveal_timer.start(2000)  # 2 seconds
+        self.start_phase(ReviewPhase.REVEAL, 2000)  # 2 seconds
     
     def advance_to_next_flashcard(self):
         """Advance to next flashcard after meaning reveal"""
         # Record success
         if self.current_index < len(self.current_flashcards):
-            current_flashcard = self.current_flashcards[self.current_index]
-            self.results[current_flashcard.id] = "True"
+            self.card_results[self.current_index] = "True"
         
         # Move to next flashcard
         self.current_index += 1
         self.show_current_flashcard()
     
+    def set_options(self, buttons: List[QPushButton], options: List[str], correct_answer: str):
+        """Fill the reusable option buttons for the current flashcard"""
+        self.current_options = options
+        self.current_correct_answer = correct_answer
+        
+        for i, button in enumerate(buttons):
+            if i < len(options):
+                button.setText(_MC_PREFIXES[i] + options[i])
+                button.show()
+            else:
+                button.hide()
+    
+    def handle_option_clicked(self, index: int, checked: bool = False):
+        """Handle a click on one of the multiple choice buttons"""
+        if index < len(self.current_options):
+            self.check_multiple_choice_answer(self.current_options[index], self.current_correct_answer)
+    
     def show_multiple_choice_meaning(self, flashcard: FlashCard):
         """Stage 2: Multiple choice meaning given word"""
-        # Word
-        word_label = QLabel(flashcard.word)
-        word_label.setAlignment(Qt.AlignCenter)
-        word_label.setStyleSheet("font-size: 20px; font-weight: bold; color: #FFFFFF; margin: 10px; background-color: transparent; border: none;")
-        
-        # Example (if available)
-        if flashcard.example:
-            example_label = QLabel(f"Example: {flashcard.example}")
-            example_label.setAlignment(Qt.AlignCenter)
-            example_label.setStyleSheet("font-size: 12px; color: #B0B0B0; margin: 5px; font-style: italic; background-color: transparent; border: none;")
-            example_label.setWordWrap(True)
-            self.content_layout.addWidget(example_label)
+        self.meaning_choice_word_label.setText(flashcard.word)
+        self.set_optional_text(self.meaning_choice_example_label, f"Example: {flashcard.example}" if flashcard.example else "")
         
         # Get contextual meanings for options
         options = self.get_multiple_choice_meanings_for_stage2(flashcard)
-        
-        # Create buttons for options
-        button_layout = QVBoxLayout()
-        button_layout.setSpacing(8)  # Tăng spacing từ 3 lên 8
-        
-        for i, option in enumerate(options):
-            button = QPushButton(f"{chr(65+i)}. {option}")
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #E0E0E0;
-                    color: #121212;
-                    border: none;
-                    padding: 6px 8px;
-                    border-radius: 4px;
-                    font-weight: normal;
-                    font-size: 12px;
-                    text-align: left;
-                    margin: 0px;
-                    min-height: 25px;
-                    max-height: 35px;
-                }
-                QPushButton:hover {
-                    background-color: #F0F0F0;
-                }
-                QPushButton:pressed {
-                    background-color: #D0D0D0;
-                }
-            """)
-            
-            # Set minimum size to ensure text fits
-            button.setMinimumHeight(30)
-            button.setMaximumHeight(40)
-            
-            button.clicked.connect(lambda checked=False, opt=option: self.check_multiple_choice_answer(opt, flashcard.meaning))
-            button_layout.addWidget(button)
-        
-        self.content_layout.addWidget(word_label)
-        self.content_layout.addLayout(button_layout)
+        self.set_options(self.meaning_choice_buttons, options, flashcard.meaning)
+        self.stack.setCurrentWidget(self.meaning_choice_page)
     
     def show_multiple_choice(self, flashcard: FlashCard):
         """Stage 3: Multiple choice word from meaning"""
-        # Meaning
-        meaning_label = QLabel(flashcard.meaning)
-        meaning_label.setAlignment(Qt.AlignCenter)
-        meaning_label.setStyleSheet("font-size: 16px; color: #FFFFFF; margin: 10px; background-color: transparent; border: none;")
-        meaning_label.setWordWrap(True)
+        self.word_choice_meaning_label.setText(flashcard.meaning)
         
         # Get random words for options
         options = self.get_multiple_choice_options(flashcard)
-        
-        # Create buttons for options
-        button_layout = QVBoxLayout()
-        button_layout.setSpacing(8)  # Tăng spacing từ 3 lên 8
-        
-        for i, option in enumerate(options):
-            button = QPushButton(f"{chr(65+i)}. {option}")
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #E0E0E0;
-                    color: #121212;
-                    border: none;
-                    padding: 6px 8px;
-                    border-radius: 4px;
-                    font-weight: normal;
-                    font-size: 12px;
-                    text-align: left;
-                    margin: 0px;
-                    min-height: 25px;
-                    max-height: 35px;
-                }
-                QPushButton:hover {
-                    background-color: #F0F0F0;
-                }
-                QPushButton:pressed {
-                    background-color: #D0D0D0;
-                }
-            """)
-            
-            # Set minimum size to ensure text fits
-            button.setMinimumHeight(30)
-            button.setMaximumHeight(40)
-            
-            button.clicked.connect(lambda checked=False, opt=option: self.check_multiple_choice_answer(opt, flashcard.word))
-            button_layout.addWidget(button)
-        
-        self.content_layout.addWidget(meaning_label)
-        self.content_layout.addLayout(button_layout)
+        self.set_options(self.word_choice_buttons, options, flashcard.word)
+        self.stack.setCurrentWidget(self.word_choice_page)
     
-    def show_input_word_with_hints(self, flashcard: FlashCard):
-        """Stage 4: Input word with spelling hints (30% characters shown)"""        
-        # Generate spelling hints
-        word = flashcard.word.lower()
-        hint_pattern = self.generate_spelling_hints(word)
-        
-        # Meaning
-        meaning_label = QLabel(flashcard.meaning)
-        meaning_label.setAlignment(Qt.AlignCenter)
-        meaning_label.setStyleSheet("font-size: 16px; color: #FFFFFF; margin: 10px; background-color: transparent; border: none;")
-        meaning_label.setWordWrap(True)
-        
-        # Example (if available)
-        if flashcard.example:
-            example_label = QLabel(f"Example: {flashcard.example}")
-            example_label.setAlignment(Qt.AlignCenter)
-            example_label.setStyleSheet("font-size: 12px; color: #B0B0B0; margin: 5px; font-style: italic; background-color: transparent; border: none;")
-            example_label.setWordWrap(True)
-            self.content_layout.addWidget(example_label)
-        
-        # Hint pattern display
-        hint_label = QLabel(f"Hint: {hint_pattern}")
-        hint_label.setAlignment(Qt.AlignCenter)
-        hint_label.setStyleSheet("font-size: 14px; color: #FFD700; margin: 5px; font-family: monospace; background-color: transparent; border: none;")
-        
-        # Input field
-        self.answer_input = QLineEdit()
-        self.answer_input.setPlaceholderText("Fill in the missing letters...")
-        self.answer_input.setStyleSheet("""
-            QLineEdit {
-                background-color: rgba(18, 18, 18, 0.5);
-                color: #E0E0E0;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 11px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #888888;
-                background-color: rgba(18, 18, 18, 0.7);
-            }
-            QLineEdit::placeholder {
-                color: #B0B0B0;
-            }
-        """)
-        
-        # Submit button
-        submit_button = QPushButton("Submit")
-        submit_button.setStyleSheet("""
-            QPushButton {
-                background-color: #888888;
-                color: #ffffff;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #999999;
-            }
-            QPushButton:pressed {
-                background-color: #777777;
-            }
-        """)
-        
-        self.content_layout.addWidget(meaning_label)
-        self.content_layout.addWidget(hint_label)
-        self.content_layout.addWidget(self.answer_input)
-        self.content_layout.addWidget(submit_button)
+    def show_input_page(self, flashcard: FlashCard, hint_pattern: str, placeholder: str):
+        """Shared Stage 4/5 display, hint label is hidden when hint_pattern is empty"""
+        self.input_meaning_label.setText(flashcard.meaning)
+        self.set_optional_text(self.input_example_label, f"Example: {flashcard.example}" if flashcard.example else "")
+        self.set_optional_text(self.hint_label, f"Hint: {hint_pattern}" if hint_pattern else "")
         
-        # Connect signals
-        submit_button.clicked.connect(lambda: self.check_input_answer(flashcard.word))
-        self.answer_input.returnPressed.connect(lambda: self.check_input_answer(flashcard.word))
+        self.answer_input = self.input_field
+        self.answer_input.clear()
+        self.answer_input.setPlaceholderText(placeholder)
+        self.stack.setCurrentWidget(self.input_page)
         
         # Focus on input
         self.answer_input.setFocus()
     
+    def show_input_word_with_hints(self, flashcard: FlashCard):
+        """Stage 4: Input word with spelling hints (30% characters shown)"""
+        # Generate spelling hints
+        hint_pattern = self.generate_spelling_hints(flashcard.word.lower())
+        self.show_input_page(flashcard, hint_pattern, "Fill in the missing letters...")
+    
     def show_input_word(self, flashcard: FlashCard):
         """Stage 5: Input word given meaning (no hints)"""
-        # Meaning
-        meaning_label = QLabel(flashcard.meaning)
-        meaning_label.setAlignment(Qt.AlignCenter)
-        meaning_label.setStyleSheet("font-size: 16px; color: #FFFFFF; margin: 10px; background-color: transparent; border: none;")
-        meaning_label.setWordWrap(True)
-        
-        # Example (if available)
-        if flashcard.example:
-            example_label = QLabel(f"Example: {flashcard.example}")
-            example_label.setAlignment(Qt.AlignCenter)
-            example_label.setStyleSheet("font-size: 12px; color: #B0B0B0; margin: 5px; font-style: italic; background-color: transparent; border: none;")
-            example_label.setWordWrap(True)
-            self.content_layout.addWidget(example_label)
-        
-        # Input field
-        self.answer_input = QLineEdit()
-        self.answer_input.setPlaceholderText("Enter the word...")
-        self.answer_input.setStyleSheet("""
-            QLineEdit {
-                background-color: rgba(18, 18, 18, 0.5);
-                color: #E0E0E0;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 11px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #888888;
-                background-color: rgba(18, 18, 18, 0.7);
-            }
-            QLineEdit::placeholder {
-                color: #B0B0B0;
-            }
-        """)
-        
-        # Submit button
-        submit_button = QPushButton("Submit")
-        submit_button.setStyleSheet("""
-            QPushButton {
-                background-color: #888888;
-                color: #ffffff;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #999999;
-            }
-            QPushButton:pressed {
-                background-color: #777777;
-            }
-        """)
-        
-        self.content_layout.addWidget(meaning_label)
-        self.content_layout.addWidget(self.answer_input)
-        self.content_layout.addWidget(submit_button)
-        
-        # Connect signals
-        submit_button.clicked.connect(lambda: self.check_input_answer(flashcard.word))
-        self.answer_input.returnPressed.connect(lambda: self.check_input_answer(flashcard.word))
-        
-        # Focus on input
-        self.answer_input.setFocus()
+        self.show_input_page(flashcard, "", "Enter the word...")
+    
+    def sample_distractors(self, pool: List[str], pool_set: set, answer: str, count: int = 3) -> List[str]:
+        """Pick up to count random entries of pool other than answer"""
+        if answer in pool_set:
+            pool = [entry for entry in pool if entry != answer]
+        return random.sample(pool, min(count, len(pool)))
+    
+    def fill_with_defaults(self, options: List[str], defaults: tuple, count: int = 4):
+        """Append unused defaults to options until it holds count entries"""
+        existing = set(options)
+        for default in defaults:
+            if default not in existing:
+                options.append(default)
+                existing.add(default)
+                if len(options) >= count:
+                    break
     
     def get_multiple_choice_meanings_for_stage2(self, flashcard: FlashCard):
         """Get 4 meaning options for Stage 2 multiple choice (1 correct + 3 contextual)"""
-        options = [flashcard.meaning]
-        
-        # Add contextual meanings
-        available_meanings = [m for m in self.contextual_meanings if m != flashcard.meaning]
-        random.shuffle(available_meanings)
-        
         # Add up to 3 contextual meanings
-        for meaning in available_meanings[:3]:
-            options.append(meaning)
+        options = [flashcard.meaning] + self.sample_distractors(
+            self.contextual_meanings, self.contextual_meaning_set, flashcard.meaning)
         
         # If not enough meanings, add defaults
-        default_meanings = [
-            "a common example word",
-            "a test meaning for practice",
-            "a sample definition",
-            "a demonstration phrase",
-            "a placeholder meaning"
-        ]
-        for meaning in default_meanings:
-            if len(options) < 4 and meaning not in options:
-                options.append(meaning)
+        if len(options) < 4:
+            self.fill_with_defaults(options, _DEFAULT_MEANINGS)
         
         # Shuffle options
-        random.shuffle(options)
-        
-        return options[:4]
+        return random.sample(options, len(options))
     
     def get_multiple_choice_options(self, flashcard: FlashCard):
         """Get 4 options for Stage 3 multiple choice (1 correct + 3 contextual)"""
-        options = [flashcard.word]
-        
-        # Add contextual words
-        available_words = [w for w in self.contextual_words if w != flashcard.word]
-        random.shuffle(available_words)
-        
         # Add up to 3 contextual words
-        for word in available_words[:3]:
-            options.append(word)
+        options = [flashcard.word] + self.sample_distractors(
+            self.contextual_words, self.contextual_word_set, flashcard.word)
         
         # If not enough words, add defaults
-        default_words = ["example", "test", "word", "sample", "demo"]
-        for word in default_words:
-            if len(options) < 4 and word not in options:
-                options.append(word)
+        if len(options) < 4:
+            self.fill_with_defaults(options, _DEFAULT_WORDS)
         
         # Shuffle options
-        random.shuffle(options)
-        
-        return options[:4]
+        return random.sample(options, len(options))
     
     def generate_spelling_hints(self, word: str) -> str:
         """Generate spelling hints by showing 30% of characters randomly"""
@@ -669,13 +705,12 @@ class ReviewerModule(QWidget):
         
         return ' '.join(hint_chars)
     
-    def check_input_answer(self, correct_answer: str):
-        """Check input answer (case-insensitive, trimmed)"""
-        if hasattr(self, 'answer_input') and self.answer_input:
-            user_answer = self.answer_input.text().strip().lower()
-            correct_answer = correct_answer.strip().lower()
+    def check_input_answer(self):
+        """Check input answer against the current flashcard (case-insensitive, trimmed)"""
+        if self.answer_input is not None:
+            user_answer = self.answer_input.text().strip().casefold()
             
-            result = "True" if user_answer == correct_answer else "False"
+            result = "True" if user_answer == self.correct_answers[self.current_index] else "False"
             self.record_result(result)
         else:
             # If no input available, treat as timeout
@@ -691,11 +726,10 @@ class ReviewerModule(QWidget):
         try:
             if self.current_index < len(self.current_flashcards):
                 current_flashcard = self.current_flashcards[self.current_index]
-                self.results[current_flashcard.id] = result
+                self.card_results[self.current_index] = result
                 
                 # Stop timers
-                self.auto_close_timer.stop()
-                self.countdown_timer.stop()
+                self.phase_timer.stop()
                 
                 # Show feedback for stages 2-4 if user answered (not just Stage 1)
                 if current_flashcard.stage_id > 1 and result in ["True", "False"]:
@@ -711,111 +745,103 @@ class ReviewerModule(QWidget):
             self.finish_review()
     
     def update_countdown_display(self):
-        """Update countdown display every second"""
-        self.remaining_seconds -= 1
-        if self.remaining_seconds <= 0:
-            self.countdown_timer.stop()
-            self.timer_label.setText("Auto-close in 0s")
-        else:
-            self.timer_label.setText(f"Auto-close in {self.remaining_seconds}s")
+        """Refresh the countdown from phase_timer, waking up again only when the shown second changes"""
+        self.countdown_tick_pending = False
+        if self.phase != ReviewPhase.REVIEWING or not self.phase_timer.isActive():
+            # Answered, timed out or closed: let the tick chain end
+            return
+        
+        remaining_ms = self.phase_timer.remainingTime()
+        remaining_seconds = (remaining_ms + 999) // 1000
+        self.timer_label.setText(f"Auto-close in {remaining_seconds}s")
+        
+        self.countdown_tick_pending = True
+        QTimer.singleShot(remaining_ms - (remaining_seconds - 1) * 1000, Qt.PreciseTimer, self.update_countdown_display)
     
     def handle_timeout(self):
         """Handle auto-close timeout"""
-        # Stop countdown timer
-        self.countdown_timer.stop()
-        
-        # Stop Stage 1 meaning reveal timer if active
-        if hasattr(self, 'meaning_reveal_timer') and self.meaning_reveal_timer:
-            self.meaning_reveal_timer.stop()
-        
         if self.current_index < len(self.current_flashcards):
             current_flashcard = self.current_flashcards[self.current_index]
             
             # Check if user has typed anything for Stage 4 and 5
-            if current_flashcard.stage_id in [4, 5] and hasattr(self, 'answer_input') and self.answer_input:
+            if current_flashcard.stage_id in [4, 5] and self.answer_input is not None:
                 user_input = self.answer_input.text().strip()
                 if user_input:  # User typed something, treat as wrong answer
-                    self.results[current_flashcard.id] = "False"
+                    self.card_results[self.current_index] = "False"
                 else:  # User didn't type anything, treat as timeout
-                    self.results[current_flashcard.id] = "TIMEOUT"
+                    self.card_results[self.current_index] = "TIMEOUT"
             else:
                 # For other stages (including Stage 1), always treat as timeout
-                self.results[current_flashcard.id] = "TIMEOUT"
+                self.card_results[self.current_index] = "TIMEOUT"
             
             # Early exit: Mark all remaining flashcards as TIMEOUT and show summary
             self.mark_remaining_as_timeout()
             self.show_summary_with_timeout_message()
     
+    def start_phase(self, phase: ReviewPhase, msec: int):
+        """Enter phase and arm the shared timer for it"""
+        self.phase = phase
+        self.phase_timer.start(msec)
+    
+    def on_phase_timeout(self):
+        """Dispatch the shared timer to the handler of the current phase"""
+        if self.phase == ReviewPhase.REVIEWING:
+            self.handle_timeout()
+        elif self.phase == ReviewPhase.REVEAL:
+            self.advance_to_next_flashcard()
+        elif self.phase == ReviewPhase.FEEDBACK:
+            self.hide_feedback()
+        else:
+            self.finish_review()
+    
     def start_timer(self):
         """Start auto-close timer and countdown display"""
-        self.remaining_seconds = self.timeout_seconds
-        self.auto_close_timer.start(self.timeout_seconds * 1000)
-        
-        # Start countdown display timer (update every second)
-        self.countdown_timer.start(1000)
+        self.start_phase(ReviewPhase.REVIEWING, self.timeout_seconds * 1000)
         
-        # Update timer display
-        self.timer_label.setText(f"Auto-close in {self.remaining_seconds}s")
+        # Update timer display, a tick still pending from the previous card picks up the new deadline
+        self.timer_label.setText(f"Auto-close in {self.timeout_seconds}s")
+        if not self.countdown_tick_pending:
+            self.countdown_tick_pending = True
+            QTimer.singleShot(1000, Qt.PreciseTimer, self.update_countdown_display)
     
     def mark_remaining_as_timeout(self):
         """Mark all remaining flashcards as TIMEOUT"""
-        for i in range(self.current_index + 1, len(self.current_flashcards)):
-            remaining_flashcard = self.current_flashcards[i]
-            self.results[remaining_flashcard.id] = "TIMEOUT"
-            logger.info(f"Marking flashcard {remaining_flashcard.id} ({remaining_flashcard.word}) as TIMEOUT due to early exit")
+        remaining = self.current_flashcards[self.current_index + 1:]
+        if remaining:
+            self.card_results[self.current_index + 1:] = ["TIMEOUT"] * len(remaining)
+            logger.info(f"Marked {len(remaining)} remaining flashcards as TIMEOUT due to early exit")
     
     def show_feedback(self, flashcard: FlashCard, result: str):
         """Show feedback for 1 second after user answers"""
-        # Clear content
-        self.clear_content()
-        
         # Create feedback display
         if result == "True":
             feedback_icon = "✅"
             feedback_text = "Correct!"
-            feedback_color = "#00CC00"
         else:
             feedback_icon = "❌"
             feedback_text = "Incorrect!"
-            feedback_color = "#CC0000"
             
         # Main feedback
-        icon_label = QLabel(feedback_icon)
-        icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet(f"font-size: 40px; color: {feedback_color}; margin: 10px; background-color: transparent; border: none;")
-        
-        text_label = QLabel(feedback_text)
-        text_label.setAlignment(Qt.AlignCenter)
-        text_label.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {feedback_color}; margin: 5px; background-color: transparent; border: none;")
-        
-        self.content_layout.addWidget(icon_label)
-        self.content_layout.addWidget(text_label)
+        self.feedback_icon_label.setText(feedback_icon)
+        self.set_style_state(self.feedback_icon_label, "result", result)
+        self.feedback_text_label.setText(feedback_text)
+        self.set_style_state(self.feedback_text_label, "result", result)
         
         # Show correct answer if wrong
         if result == "False":
-            if flashcard.stage_id == 2:
-                # Stage 2: Show correct meaning
-                correct_label = QLabel(f"Correct answer: {flashcard.meaning}")
-            elif flashcard.stage_id == 3:
-                # Stage 3: Show correct word
-                correct_label = QLabel(f"Correct answer: {flashcard.word}")
-            elif flashcard.stage_id == 4:
-                # Stage 4: Show correct word
-                correct_label = QLabel(f"Correct answer: {flashcard.word}")
-            
-            correct_label.setAlignment(Qt.AlignCenter)
-            correct_label.setStyleSheet("font-size: 12px; color: #E0E0E0; margin: 5px; background-color: transparent; border: none;")
-            correct_label.setWordWrap(True)
-            self.content_layout.addWidget(correct_label)
+            # Stage 2 asks for the meaning, later stages ask for the word
+            correct_answer = flashcard.meaning if flashcard.stage_id == 2 else flashcard.word
+            self.set_optional_text(self.feedback_correct_label, f"Correct answer: {correct_answer}")
+        else:
+            self.set_optional_text(self.feedback_correct_label, "")
+        
+        self.stack.setCurrentWidget(self.feedback_page)
         
         # Hide timer during feedback
         self.timer_label.setText("")
         
         # Start 1-second timer for feedback
-        self.feedback_timer = QTimer()
-        self.feedback_timer.setSingleShot(True)
-        self.feedback_timer.timeout.connect(self.hide_feedback)
-        self.feedback_timer.start(1000)  # 1 second
+        self.start_phase(ReviewPhase.FEEDBACK, 1000)  # 1 second
     
     def hide_feedback(self):
         """Hide feedback and move to next flashcard"""
@@ -825,145 +851,102 @@ class ReviewerModule(QWidget):
     def show_summary(self):
         """Show final summary with accuracy and emoji"""
         # Reset modal size for summary
-        self.setFixedSize(380, 320)
+        self.set_modal_height(320)
         
         # Calculate accuracy
-        total_reviews = len(self.results)
-        correct_answers = sum(1 for result in self.results.values() if result == "True")
+        results = self.collect_results()
+        total_reviews = len(results)
+        correct_answers = sum(1 for result in results.values() if result == "True")
         accuracy = (correct_answers / total_reviews * 100) if total_reviews > 0 else 0
         
         # Determine emoji and message based on accuracy
         if accuracy >= 90:
             emoji = "🏆"
             message = "Excellent!"
-            color = "#FFD700"
+            tone = "excellent"
         elif accuracy >= 70:
             emoji = "🎉"
             message = "Great job!"
-            color = "#00CC00"
+            tone = "great"
         elif accuracy >= 50:
             emoji = "👍"
             message = "Good work!"
-            color = "#FFA500"
+            tone = "good"
         else:
             emoji = "💪"
             message = "Keep practicing!"
-            color = "#FF6600"
-        
-        # Clear content
-        self.clear_content()
-        
-        # Create summary display
-        emoji_label = QLabel(emoji)
-        emoji_label.setAlignment(Qt.AlignCenter)
-        emoji_label.setStyleSheet(f"font-size: 50px; margin: 10px; background-color: transparent; border: none;")
+            tone = "practice"
         
-        message_label = QLabel(message)
-        message_label.setAlignment(Qt.AlignCenter)
-        message_label.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {color}; margin: 5px; background-color: transparent; border: none;")
-        
-        accuracy_label = QLabel(f"Accuracy: {accuracy:.1f}%")
-        accuracy_label.setAlignment(Qt.AlignCenter)
-        accuracy_label.setStyleSheet("font-size: 14px; color: #E0E0E0; margin: 5px; background-color: transparent; border: none;")
-        
-        stats_label = QLabel(f"{correct_answers}/{total_reviews} correct")
-        stats_label.setAlignment(Qt.AlignCenter)
-        stats_label.setStyleSheet("font-size: 12px; color: #B0B0B0; margin: 5px; background-color: transparent; border: none;")
-        
-        self.content_layout.addWidget(emoji_label)
-        self.content_layout.addWidget(message_label)
-        self.content_layout.addWidget(accuracy_label)
-        self.content_layout.addWidget(stats_label)
+        # Fill summary display
+        self.summary_emoji_label.setText(emoji)
+        self.summary_message_label.setText(message)
+        self.set_style_state(self.summary_message_label, "tone", tone)
+        self.summary_detail_label.setText(f"Accuracy: {accuracy:.1f}%")
+        self.set_optional_text(self.summary_stats_label, f"{correct_answers}/{total_reviews} correct")
+        self.stack.setCurrentWidget(self.summary_page)
         
         # Update progress
         self.progress_label.setText("Review Complete!")
         self.timer_label.setText("")
         
         # Start 3-second timer for summary
-        self.summary_timer = QTimer()
-        self.summary_timer.setSingleShot(True)
-        self.summary_timer.timeout.connect(self.finish_review)
-        self.summary_timer.start(3000)  # 3 seconds
+        self.start_phase(ReviewPhase.SUMMARY, 3000)  # 3 seconds
     
     def show_summary_with_timeout_message(self):
         """Show summary with timeout/escape message"""
         # Reset modal size for summary
-        self.setFixedSize(380, 320)
-        
-        # Clear content
-        self.clear_content()
-        
-        # Create timeout message display
-        emoji_label = QLabel("⏰")
-        emoji_label.setAlignment(Qt.AlignCenter)
-        emoji_label.setStyleSheet("font-size: 50px; margin: 10px; background-color: transparent; border: none;")
+        self.set_modal_height(320)
         
-        message_label = QLabel("No worries!")
-        message_label.setAlignment(Qt.AlignCenter)
-        message_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #FFA500; margin: 5px; background-color: transparent; border: none;")
-        
-        info_label = QLabel("Come back when you're ready")
-        info_label.setAlignment(Qt.AlignCenter)
-        info_label.setStyleSheet("font-size: 14px; color: #E0E0E0; margin: 5px; background-color: transparent; border: none;")
-        
-        self.content_layout.addWidget(emoji_label)
-        self.content_layout.addWidget(message_label)
-        self.content_layout.addWidget(info_label)
+        # Fill timeout message display
+        self.summary_emoji_label.setText("⏰")
+        self.summary_message_label.setText("No worries!")
+        self.set_style_state(self.summary_message_label, "tone", "paused")
+        self.summary_detail_label.setText("Come back when you're ready")
+        self.set_optional_text(self.summary_stats_label, "")
+        self.stack.setCurrentWidget(self.summary_page)
         
         # Update progress
         self.progress_label.setText("Session Paused")
         self.timer_label.setText("")
         
         # Start 3-second timer for summary
-        self.summary_timer = QTimer()
-        self.summary_timer.setSingleShot(True)
-        self.summary_timer.timeout.connect(self.finish_review)
-        self.summary_timer.start(3000)  # 3 seconds
+        self.start_phase(ReviewPhase.SUMMARY, 3000)  # 3 seconds
     
     def finish_review(self):
         """Finish review session with comprehensive cleanup"""
-        logger.info(f"Review session completed with {len(self.results)} results")
+        logger.info(f"Review session completed with {len(self.card_results) - self.card_results.count(None)} results")
         
         # Comprehensive timer cleanup
         self.cleanup_all_timers()
         
-        # Clear content to prevent any lingering UI elements
-        self.clear_content()
-        
         # Reset internal state
         self.current_index = 0
-        self.remaining_seconds = 0
         
         # Hide window
         self.hide()
         
         # Emit results
-        self.review_completed.emit(self.results)
+        self.emit_results()
         
         logger.info("Review session cleanup completed successfully")
     
+    def emit_results(self):
+        """Emit review_completed, at most once per session"""
+        if self.results_emitted:
+            return
+        self.results_emitted = True
+        self.review_completed.emit(self.collect_results())
+    
+    def collect_results(self) -> Dict[int, str]:
+        """Build the {flashcard_id: result} dict from the per-position results"""
+        return {flashcard.id: result for flashcard, result in zip(self.current_flashcards, self.card_results)
+                if result is not None}
+    
     def cleanup_all_timers(self):
         """Comprehensive cleanup of all timers"""
         try:
-            # Stop main timers
-            if hasattr(self, 'auto_close_timer') and self.auto_close_timer:
-                self.auto_close_timer.stop()
-                
-            if hasattr(self, 'countdown_timer') and self.countdown_timer:
-                self.countdown_timer.stop()
-                
-            # Stop feedback timer
-            if hasattr(self, 'feedback_timer') and self.feedback_timer:
-                self.feedback_timer.stop()
-                
-            # Stop summary timer
-            if hasattr(self, 'summary_timer') and self.summary_timer:
-                self.summary_timer.stop()
-                
-            # Stop Stage 1 meaning reveal timer
-            if hasattr(self, 'meaning_reveal_timer') and self.meaning_reveal_timer:
-                self.meaning_reveal_timer.stop()
-                
+            # Stop the phase timer, which covers auto-close, meaning reveal, feedback and summary
+            self.phase_timer.stop()
             logger.debug("All timers stopped successfully")
             
         except Exception as e:
@@ -971,35 +954,36 @@ class ReviewerModule(QWidget):
     
     def keyPressEvent(self, event):
         """Handle key press events"""
-        if event.key() == Qt.Key_Escape:
+        handler = self.key_handlers.get(event.key())
+        if handler is not None:
             # ESC key pressed - close modal immediately
-            self.handle_escape_key()
+            handler()
         else:
             super().keyPressEvent(event)
     
     def handle_escape_key(self):
         """Handle ESC key press - close modal immediately"""
-        # Stop Stage 1 meaning reveal timer if active
-        if hasattr(self, 'meaning_reveal_timer') and self.meaning_reveal_timer:
-            self.meaning_reveal_timer.stop()
+        if self.phase == ReviewPhase.SUMMARY:
+            # Summary already on screen: close it now instead of waiting for the summary timer
+            self.finish_review()
+            return
         
         if self.current_index < len(self.current_flashcards):
+            # Stop timers, including the Stage 1 meaning reveal and the feedback delay
+            self.phase_timer.stop()
+            
             current_flashcard = self.current_flashcards[self.current_index]
             
             # Check if user has typed anything for Stage 4 and 5
-            if current_flashcard.stage_id in [4, 5] and hasattr(self, 'answer_input') and self.answer_input:
+            if current_flashcard.stage_id in [4, 5] and self.answer_input is not None:
                 user_input = self.answer_input.text().strip()
                 if user_input:  # User typed something, treat as wrong answer
-                    self.results[current_flashcard.id] = "False"
+                    self.card_results[self.current_index] = "False"
                 else:  # User didn't type anything, treat as ESC
-                    self.results[current_flashcard.id] = "ESCAPE"
+                    self.card_results[self.current_index] = "ESCAPE"
             else:
                 # For other stages (including Stage 1), always treat as ESC
-                self.results[current_flashcard.id] = "ESCAPE"
-            
-            # Stop timers
-            self.auto_close_timer.stop()
-            self.countdown_timer.stop()
+                self.card_results[self.current_index] = "ESCAPE"
             
             # Early exit: Mark all remaining flashcards as TIMEOUT and show summary
             self.mark_remaining_as_timeout()
@@ -1012,27 +996,22 @@ class ReviewerModule(QWidget):
         # Comprehensive timer cleanup
         self.cleanup_all_timers()
         
-        # Clear content to prevent any lingering UI elements
-        self.clear_content()
-        
         # If review was incomplete, mark remaining as timeout
-        if self.current_index < len(self.current_flashcards):
+        # (a finished session already emitted its results, they must not be rewritten)
+        if not self.results_emitted and self.current_index < len(self.current_flashcards):
             # Mark current flashcard as TIMEOUT if not already recorded
-            if self.current_index < len(self.current_flashcards):
-                current_flashcard = self.current_flashcards[self.current_index]
-                if current_flashcard.id not in self.results:
-                    self.results[current_flashcard.id] = "TIMEOUT"
+            if self.card_results[self.current_index] is None:
+                self.card_results[self.current_index] = "TIMEOUT"
             
             # Mark all remaining flashcards as TIMEOUT
             self.mark_remaining_as_timeout()
         
         # Emit results if any
-        if self.results:
-            self.review_completed.emit(self.results)
+        if any(result is not None for result in self.card_results):
+            self.emit_results()
         
         # Reset state for next session
         self.current_index = 0
-        self.remaining_seconds = 0
         
         logger.info("ReviewerModule close event cleanup completed")
         event.accept()
\ No newline at end of file
@@ -14,6 +14,121 @@ from src.utils.sound_manager import get_sound_manager
 
 logger = logging.getLogger(__name__)
 
+# Stylesheets are parsed once per window through object name selectors
+_CONTAINER_QSS = """
+    * {
+        background-color: #676767;
+    }
+    #settingsContainer,
+    #settingsContainer QWidget {
+        background-color: rgba(68, 68, 68, 0.95);
+        border: 1px solid #444444;
+        border-radius: 8px;
+    }
+"""
+
+_LABEL_QSS = """
+    QLabel#settingsTitle {
+        font-size: 18px;
+        font-weight: bold;
+        color: #FFFFFF;
+        margin: 0px 0px 10px 0px;
+        background-color: transparent;
+        border: none;
+    }
+    QLabel#fieldLabel {
+        color: #E0E0E0;
+        font-size: 12px;
+        background-color: transparent;
+    }
+    QLabel#completionLabel {
+        color: #B0B0B0;
+        font-size: 11px;
+        font-style: italic;
+        background-color: transparent;
+        margin-left: 20px;
+    }
+"""
+
+_GROUP_QSS = """
+    #settingsContainer QGroupBox {
+        font-size: 14px;
+        font-weight: bold;
+        color: #E0E0E0;
+        border: 2px solid #444444;
+        border-radius: 6px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: transparent;
+    }
+    #settingsContainer QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 8px 0 8px;
+        color: #FFFFFF;
+        background-color: rgba(68, 68, 68, 0.95);
+    }
+"""
+
+_CHECKBOX_QSS = """
+    #settingsContainer QCheckBox {
+        color: #E0E0E0;
+        font-size: 12px;
+        background-color: transparent;
+        spacing: 8px;
+    }
+    #settingsContainer QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border: 2px solid #888888;
+        border-radius: 3px;
+        background-color: rgba(18, 18, 18, 0.5);
+    }
+    #settingsContainer QCheckBox::indicator:checked {
+        background-color: #888888;
+        border: 2px solid #AAAAAA;
+    }
+    #settingsContainer QCheckBox::indicator:checked::after {
+        content: "✓";
+        color: #FFFFFF;
+        font-weight: bold;
+        font-size: 14px;
+    }
+"""
+
+_INPUT_QSS = """
+    #settingsContainer QSpinBox, #settingsContainer QTimeEdit {
+        color: #E0E0E0;
+        background-color: rgba(18, 18, 18, 0.5);
+        border: 2px solid #888888;
+        border-radius: 3px;
+        padding: 4px;
+        font-size: 12px;
+        min-width: 80px;
+    }
+    #settingsContainer QSpinBox:focus, #settingsContainer QTimeEdit:focus {
+        border: 2px solid #888888;
+    }
+"""
+
+_BUTTON_QSS = """
+    QPushButton#resetButton, QPushButton#closeButton {
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QPushButton#resetButton { background-color: #E0E0E0; color: #121212; min-width: 100px; }
+    QPushButton#resetButton:hover { background-color: #F0F0F0; }
+    QPushButton#resetButton:pressed { background-color: #D0D0D0; }
+    QPushButton#closeButton { background-color: #888888; color: #ffffff; min-width: 80px; }
+    QPushButton#closeButton:hover { background-color: #999999; }
+    QPushButton#closeButton:pressed { background-color: #777777; }
+"""
+
+_GLOBAL_QSS = _CONTAINER_QSS + _LABEL_QSS + _GROUP_QSS + _CHECKBOX_QSS + _INPUT_QSS + _BUTTON_QSS
+
 class SettingsWindow(QWidget):
     """
     Settings window for configuring application preferences
@@ -29,6 +144,9 @@ class SettingsWindow(QWidget):
         self.setup_window_properties()
         self.load_current_settings()
         
+        # Keys handled by the window, anything else goes to QWidget
+        self.key_handlers = {Qt.Key_Escape: self.close}
+        
     def setup_ui(self):
         """Setup the user interface"""
         self.setWindowTitle("Drip Settings")
@@ -36,13 +154,7 @@ class SettingsWindow(QWidget):
         
         # Create main container widget with dark theme
         self.container = QWidget()
-        self.container.setStyleSheet("""
-            QWidget {
-                background-color: rgba(68, 68, 68, 0.95);
-                border: 1px solid #444444;
-                border-radius: 8px;
-            }
-        """)
+        self.container.setObjectName("settingsContainer")
         
         # Main layout for the window
         window_layout = QVBoxLayout()
@@ -59,37 +171,11 @@ class SettingsWindow(QWidget):
         # Title
         title_label = QLabel("Settings")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("""
-            font-size: 18px; 
-            font-weight: bold; 
-            color: #FFFFFF; 
-            margin: 0px 0px 10px 0px; 
-            background-color: transparent; 
-            border: none;
-        """)
+        title_label.setObjectName("settingsTitle")
         main_layout.addWidget(title_label)
         
         # Alert Settings Group
         alert_group = QGroupBox("Alert Settings")
-        alert_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 14px;
-                font-weight: bold;
-                color: #E0E0E0;
-                border: 2px solid #444444;
-                border-radius: 6px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: transparent;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #FFFFFF;
-                background-color: rgba(68, 68, 68, 0.95);
-            }
-        """)
         
         alert_layout = QVBoxLayout()
         alert_layout.setSpacing(10)
@@ -97,31 +183,6 @@ class SettingsWindow(QWidget):
         
         # Sound notification checkbox
         self.sound_checkbox = QCheckBox("Enable notification sound for vocabulary reviews")
-        self.sound_checkbox.setStyleSheet("""
-            QCheckBox {
-                color: #E0E0E0;
-                font-size: 12px;
-                background-color: transparent;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #888888;
-                border-radius: 3px;
-                background-color: rgba(18, 18, 18, 0.5);
-            }
-            QCheckBox::indicator:checked {
-                background-color: #888888;
-                border: 2px solid #AAAAAA;
-            }
-            QCheckBox::indicator:checked::after {
-                content: "✓";
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-            }
-        """)
         self.sound_checkbox.toggled.connect(self.on_sound_toggled)
         
         alert_layout.addWidget(self.sound_checkbox)
@@ -131,25 +192,6 @@ class SettingsWindow(QWidget):
         
         # Auto-Insert Settings Group
         auto_insert_group = QGroupBox("Auto-Insert Settings")
-        auto_insert_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 14px;
-                font-weight: bold;
-                color: #E0E0E0;
-                border: 2px solid #444444;
-                border-radius: 6px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: transparent;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #FFFFFF;
-                background-color: rgba(68, 68, 68, 0.95);
-            }
-        """)
         
         auto_insert_layout = QVBoxLayout()
         auto_insert_layout.setSpacing(10)
@@ -157,31 +199,6 @@ class SettingsWindow(QWidget):
         
         # Enable auto-insert checkbox
         self.auto_insert_checkbox = QCheckBox("Enable daily auto-insert new vocabulary")
-        self.auto_insert_checkbox.setStyleSheet("""
-            QCheckBox {
-                color: #E0E0E0;
-                font-size: 12px;
-                background-color: transparent;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #888888;
-                border-radius: 3px;
-                background-color: rgba(18, 18, 18, 0.5);
-            }
-            QCheckBox::indicator:checked {
-                background-color: #888888;
-                border: 2px solid #AAAAAA;
-            }
-            QCheckBox::indicator:checked::after {
-                content: "✓";
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-            }
-        """)
         self.auto_insert_checkbox.toggled.connect(self.on_auto_insert_toggled)
         
         auto_insert_layout.addWidget(self.auto_insert_checkbox)
@@ -189,29 +206,11 @@ class SettingsWindow(QWidget):
         # Daily count setting
         count_layout = QHBoxLayout()
         count_label = QLabel("Daily count:")
-        count_label.setStyleSheet("""
-            color: #E0E0E0;
-            font-size: 12px;
-            background-color: transparent;
-        """)
+        count_label.setObjectName("fieldLabel")
         
         self.count_spinbox = QSpinBox()
         self.count_spinbox.setRange(1, 50)
         self.count_spinbox.setValue(10)
-        self.count_spinbox.setStyleSheet("""
-            QSpinBox {
-                color: #E0E0E0;
-                background-color: rgba(18, 18, 18, 0.5);
-                border: 2px solid #888888;
-                border-radius: 3px;
-                padding: 4px;
-                font-size: 12px;
-                min-width: 80px;
-            }
-            QSpinBox:focus {
-                border: 2px solid #888888;
-            }
-        """)
         self.count_spinbox.valueChanged.connect(self.on_count_changed)
         
         count_layout.addWidget(count_label)
@@ -222,41 +221,17 @@ class SettingsWindow(QWidget):
         
         # Dataset completion info
         self.completion_label = QLabel("Dataset completion: Calculating...")
-        self.completion_label.setStyleSheet("""
-            color: #B0B0B0;
-            font-size: 11px;
-            font-style: italic;
-            background-color: transparent;
-            margin-left: 20px;
-        """)
+        self.completion_label.setObjectName("completionLabel")
         auto_insert_layout.addWidget(self.completion_label)
         
         # Time setting
         time_layout = QHBoxLayout()
         time_label = QLabel("Daily time:")
-        time_label.setStyleSheet("""
-            color: #E0E0E0;
-            font-size: 12px;
-            background-color: transparent;
-        """)
+        time_label.setObjectName("fieldLabel")
         
         self.time_edit = QTimeEdit()
         self.time_edit.setTime(QTime(7, 0))  # Default 7:00 AM
         self.time_edit.setDisplayFormat("HH:mm")
-        self.time_edit.setStyleSheet("""
-            QTimeEdit {
-                color: #E0E0E0;
-                background-color: rgba(18, 18, 18, 0.5);
-                border: 2px solid #888888;
-                border-radius: 3px;
-                padding: 4px;
-                font-size: 12px;
-                min-width: 80px;
-            }
-            QTimeEdit:focus {
-                border: 2px solid #888888;
-            }
-        """)
         self.time_edit.timeChanged.connect(self.on_time_changed)
         
         time_layout.addWidget(time_label)
@@ -277,46 +252,12 @@ class SettingsWindow(QWidget):
         
         # Reset button
         reset_button = QPushButton("Reset to Default")
-        reset_button.setStyleSheet("""
-            QPushButton {
-                background-color: #E0E0E0;
-                color: #121212;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 11px;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #F0F0F0;
-            }
-            QPushButton:pressed {
-                background-color: #D0D0D0;
-            }
-        """)
+        reset_button.setObjectName("resetButton")
         reset_button.clicked.connect(self.reset_to_default)
         
         # Close button
         close_button = QPushButton("Close")
-        close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #888888;
-                color: #ffffff;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 11px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #999999;
-            }
-            QPushButton:pressed {
-                background-color: #777777;
-            }
-        """)
+        close_button.setObjectName("closeButton")
         close_button.clicked.connect(self.close)
         
         button_layout.addWidget(reset_button)
@@ -331,8 +272,8 @@ class SettingsWindow(QWidget):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
         
-        # Set window background color
-        self.setStyleSheet("background-color: #676767;")
+        # Window background and every child widget style
+        self.setStyleSheet(_GLOBAL_QSS)
         
         # Enable key press events
         self.setFocusPolicy(Qt.StrongFocus)
@@ -340,38 +281,49 @@ class SettingsWindow(QWidget):
     def load_current_settings(self):
         """Load current settings into UI"""
         try:
-            # Load sound setting
-            self.sound_checkbox.setChecked(self.sound_manager.is_sound_enabled())
-            
-            # Load auto-insert settings
-            auto_insert_settings = self.load_auto_insert_settings()
-            self.auto_insert_checkbox.setChecked(auto_insert_settings.get('enabled', False))
-            self.count_spinbox.setValue(auto_insert_settings.get('daily_count', 10))
-            
-            # Load time setting
-            hour = auto_insert_settings.get('hour', 7)
-            minute = auto_insert_settings.get('minute', 0)
-            self.time_edit.setTime(QTime(hour, minute))
+            # Programmatic updates must not trigger the on_*_changed handlers (file writes, signals)
+            self.block_input_signals(True)
+            try:
+                # Load sound setting
+                self.sound_checkbox.setChecked(self.sound_manager.is_sound_enabled())
+                
+                # Load auto-insert settings
+                auto_insert_settings = self.load_auto_insert_settings()
+                self.auto_insert_checkbox.setChecked(auto_insert_settings.get('enabled', False))
+                self.count_spinbox.setValue(auto_insert_settings.get('daily_count', 10))
+                
+                # Load time setting
+                hour = auto_insert_settings.get('hour', 7)
+                minute = auto_insert_settings.get('minute', 0)
+                self.time_edit.setTime(QTime(hour, minute))
+            finally:
+                self.block_input_signals(False)
             
             # Update completion label
             self.update_completion_label()
             
         except Exception as e:
-            logger.error(f"Error loading current settings: {e}")
+            logger.error("Error loading current settings: %s", e)
+    
+    def block_input_signals(self, blocked: bool):
+        """Block or unblock the change signals of every settings input"""
+        for widget in (self.sound_checkbox, self.auto_insert_checkbox, self.count_spinbox, self.time_edit):
+            widget.blockSignals(blocked)
     
     def on_sound_toggled(self, checked: bool):
         """Handle sound checkbox toggle"""
         try:
-            self.sound_manager.set_sound_enabled(checked)
+            if not self.sound_manager.set_sound_enabled(checked):
+                return
             
             status = "enabled" if checked else "disabled"
-            logger.info(f"Sound notifications {status}")
+            logger.info("Sound notifications %s", status)
             
             # Emit settings updated signal
             self.settings_updated.emit()
             
         except Exception as e:
-            logger.error(f"Error toggling sound setting: {e}")
+            logger.error("Error toggling sound setting: %s", e)
     
     def load_auto_insert_settings(self):
         """Load auto-insert settings from file"""
@@ -393,7 +345,7 @@ class SettingsWindow(QWidget):
                     'minute': 0
                 }
         except Exception as e:
-            logger.error(f"Error loading auto-insert settings: {e}")
+            logger.error("Error loading auto-insert settings: %s", e)
             return {
                 'enabled': False,
                 'daily_count': 10,
@@ -417,10 +369,10 @@ class SettingsWindow(QWidget):
             with open(self.sound_manager.settings_file, 'w', encoding='utf-8') as f:
                 json.dump(existing_settings, f, indent=2, ensure_ascii=False)
             
-            logger.info(f"Saved auto-insert settings: {settings}")
+            logger.info("Saved auto-insert settings: %s", settings)
             
         except Exception as e:
-            logger.error(f"Error saving auto-insert settings: {e}")
+            logger.error("Error saving auto-insert settings: %s", e)
     
     def on_auto_insert_toggled(self, checked: bool):
         """Handle auto-insert checkbox toggle"""
@@ -433,13 +385,13 @@ class SettingsWindow(QWidget):
             self.save_auto_insert_settings(current_settings)
             
             status = "enabled" if checked else "disabled"
-            logger.info(f"Auto-insert {status}")
+            logger.info("Auto-insert %s", status)
             
             # Emit settings updated signal
             self.settings_updated.emit()
             
         except Exception as e:
-            logger.error(f"Error toggling auto-insert setting: {e}")
+            logger.error("Error toggling auto-insert setting: %s", e)
     
     def on_count_changed(self, value: int):
         """Handle daily count change"""
@@ -451,7 +403,7 @@ class SettingsWindow(QWidget):
             # Save settings
             self.save_auto_insert_settings(current_settings)
             
-            logger.info(f"Auto-insert daily count set to {value}")
+            logger.info("Auto-insert daily count set to %s", value)
             
             # Update completion label
             self.update_completion_label()
@@ -460,7 +412,7 @@ class SettingsWindow(QWidget):
             self.settings_updated.emit()
             
         except Exception as e:
-            logger.error(f"Error changing daily count: {e}")
+            logger.error("Error changing daily count: %s", e)
     
     def on_time_changed(self, time):
         """Handle time change"""
@@ -473,13 +425,13 @@ class SettingsWindow(QWidget):
             # Save settings
             self.save_auto_insert_settings(current_settings)
             
-            logger.info(f"Auto-insert time set to {time.hour():02d}:{time.minute():02d}")
+            logger.info("Auto-insert time set to %02d:%02d", time.hour(), time.minute())
             
             # Emit settings updated signal
             self.settings_updated.emit()
             
         except Exception as e:
-            logger.error(f"Error changing time: {e}")
+            logger.error("Error changing time: %s", e)
     
     def calculate_dataset_completion(self, daily_count: int) -> str:
         """Calculate dataset completion info"""
@@ -518,7 +470,7 @@ class SettingsWindow(QWidget):
             return f"Dataset completion: {days_remaining} days remaining ({remaining_words}/{total_words} words left)"
             
         except Exception as e:
-            logger.error(f"Error calculating dataset completion: {e}")
+            logger.error("Error calculating dataset completion: %s", e)
             return "Dataset completion: Calculation error"
     
     def update_completion_label(self):
@@ -529,7 +481,7 @@ class SettingsWindow(QWidget):
             self.completion_label.setText(completion_text)
             
         except Exception as e:
-            logger.error(f"Error updating completion label: {e}")
+            logger.error("Error updating completion label: %s", e)
             self.completion_label.setText("Dataset completion: Update error")
     
     def reset_to_default(self):
@@ -547,7 +499,6 @@ class SettingsWindow(QWidget):
             if reply == QMessageBox.Yes:
                 # Reset sound setting to default (enabled)
                 self.sound_manager.set_sound_enabled(True)
-                self.sound_checkbox.setChecked(True)
                 
                 # Reset auto-insert settings to default
                 default_auto_insert = {
@@ -557,9 +508,16 @@ class SettingsWindow(QWidget):
                     'minute': 0
                 }
                 self.save_auto_insert_settings(default_auto_insert)
-                self.auto_insert_checkbox.setChecked(False)
-                self.count_spinbox.setValue(10)
-                self.time_edit.setTime(QTime(7, 0))
+                
+                # Settings are already saved, only sync the widgets
+                self.block_input_signals(True)
+                try:
+                    self.sound_checkbox.setChecked(True)
+                    self.auto_insert_checkbox.setChecked(False)
+                    self.count_spinbox.setValue(10)
+                    self.time_edit.setTime(QTime(7, 0))
+                finally:
+                    self.block_input_signals(False)
                 
                 # Update completion label
                 self.update_completion_label()
@@ -570,7 +528,7 @@ class SettingsWindow(QWidget):
                 logger.info("Settings reset to default values")
                 
         except Exception as e:
-            logger.error(f"Error resetting settings: {e}")
+            logger.error("Error resetting settings: %s", e)
             QMessageBox.warning(self, "Reset Error", f"Error resetting settings: {e}")
     
     def show_settings(self):
@@ -594,13 +552,14 @@ class SettingsWindow(QWidget):
             logger.info("Settings window shown")
             
         except Exception as e:
-            logger.error(f"Error showing settings window: {e}")
+            logger.error("Error showing settings window: %s", e)
     
     def keyPressEvent(self, event):
         """Handle key press events"""
-        if event.key() == Qt.Key_Escape:
+        handler = self.key_handlers.get(event.key())
+        if handler is not None:
             # ESC key pressed - close settings
-            self.close()
+            handler()
         else:
             super().keyPressEvent(event)
     
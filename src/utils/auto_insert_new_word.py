@@ -1,5 +1,6 @@
 import json
 import sqlite3
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import os
@@ -8,6 +9,22 @@ class AutoInsertNewWord:
     def __init__(self, db_path: str = "data/drip.db", json_path: str = "insert_new_words.json"):
         self.db_path = db_path
         self.json_path = json_path
+        self._connection = None
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Connection dùng lại cho mọi lần gọi (mở khi cần lần đầu)
+        
+        Dùng với `with conn:` để commit/rollback transaction, không đóng connection
+        """
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_path)
+        return self._connection
+    
+    def close(self):
+        """Đóng connection dùng chung"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
         
     def load_words_from_json(self) -> List[Dict]:
         """Đọc từ vựng từ file JSON"""
@@ -34,7 +51,7 @@ class AutoInsertNewWord:
     
     def check_word_exists(self, word: str) -> bool:
         """Kiểm tra xem từ vựng đã tồn tại trong database chưa"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM flashcards WHERE LOWER(word) = LOWER(?)", (word,))
             count = cursor.fetchone()[0]
@@ -46,24 +63,25 @@ class AutoInsertNewWord:
         start_time = target_time - timedelta(hours=1)
         end_time = target_time + timedelta(hours=1)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
+            # created_at lưu dạng unix epoch
             cursor.execute("""
                 SELECT COUNT(*) FROM flashcards 
                 WHERE created_at >= ? AND created_at <= ?
-            """, (start_time, end_time))
+            """, (int(start_time.timestamp()), int(end_time.timestamp())))
             count = cursor.fetchone()[0]
             return count
     
     def insert_word_to_database(self, word_data: Dict) -> bool:
         """Thêm một từ vựng vào database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Sử dụng thời gian hiện tại cho created_at
-                current_time = datetime.now()
-                first_review_time = current_time + timedelta(hours=0.5)
+                # Sử dụng thời gian hiện tại (unix epoch) cho created_at
+                current_time = int(time.time())
+                first_review_time = current_time + 30 * 60
                 
                 cursor.execute("""
                     INSERT INTO flashcards (word, meaning, example, tag, stage_id, 
@@ -84,6 +102,44 @@ class AutoInsertNewWord:
             print(f"Error inserting word '{word_data.get('word', 'unknown')}': {e}")
             return False
     
+    def insert_words_to_database(self, words_data: List[Dict]) -> int:
+        """Thêm nhiều từ vựng trong một transaction (executemany), trả về số từ đã thêm"""
+        if not words_data:
+            return 0
+        
+        current_time = int(time.time())
+        first_review_time = current_time + 30 * 60
+        rows = [(
+            word_data['word'],
+            word_data['meaning'],
+            word_data.get('example', ''),
+            word_data.get('tag', 'auto-inserted'),
+            current_time,
+            first_review_time
+        ) for word_data in words_data]
+        
+        try:
+            with self._get_connection() as conn:
+                conn.executemany("""
+                    INSERT INTO flashcards (word, meaning, example, tag, stage_id, 
+                                          created_at, next_review_time, priority_score, interval_hours)
+                    VALUES (?, ?, ?, ?, 1, ?, ?, 100, 0.5)
+                """, rows)
+            return len(rows)
+            
+        except Exception as e:
+            # Transaction đã rollback - thêm lại từng từ để bỏ qua các từ bị lỗi
+            print(f"Error batch inserting words, falling back to single inserts: {e}")
+            return sum(1 for word_data in words_data if self.insert_word_to_database(word_data))
+    
+    def analyze_database(self):
+        """Chạy ANALYZE để query planner chọn đúng index sau khi insert nhiều từ"""
+        try:
+            with self._get_connection() as conn:
+                conn.execute("ANALYZE flashcards")
+        except Exception as e:
+            print(f"Error analyzing database: {e}")
+    
     def auto_insert_daily_words(self, target_count: int, target_hour: int = 7, target_minute: int = 0) -> Dict:
         """
         Tự động thêm từ vựng hàng ngày
@@ -148,17 +204,17 @@ class AutoInsertNewWord:
                     
                 new_words.append(word_data)
             
-            # Insert các từ mới vào database
-            successful_inserts = 0
-            for word_data in new_words:
-                if self.insert_word_to_database(word_data):
-                    successful_inserts += 1
-                else:
-                    result['skipped_count'] += 1
+            # Insert các từ mới vào database (một transaction cho cả lô)
+            successful_inserts = self.insert_words_to_database(new_words)
+            result['skipped_count'] += len(new_words) - successful_inserts
             
             result['inserted_count'] = successful_inserts
             result['success'] = True
             
+            # Cập nhật thống kê cho query planner sau khi insert hàng loạt
+            if successful_inserts > 0:
+                self.analyze_database()
+            
             if successful_inserts > 0:
                 result['message'] = f"Đã thêm {successful_inserts} từ vựng mới vào database"
             else:
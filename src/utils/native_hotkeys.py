@@ -0,0 +1,65 @@
+"""
+Native global hotkeys for Drip
+Registers hotkeys with the OS (RegisterHotKey on Windows) so Python only runs
+when one of our combinations is pressed, instead of on every keystroke
+"""
+
+import ctypes
+import logging
+import sys
+
+from PyQt5.QtCore import QAbstractNativeEventFilter
+
+logger = logging.getLogger(__name__)
+
+# Win32 constants
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_NOREPEAT = 0x4000
+VK_SPACE = 0x20
+WM_HOTKEY = 0x0312
+
+class NativeHotkeyFilter(QAbstractNativeEventFilter):
+    """
+    Qt native event filter dispatching WM_HOTKEY messages to callbacks.
+    Hotkeys are registered for the GUI thread, so callbacks run directly on the Qt event loop.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._callbacks = {}
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Native registration is only implemented for Windows"""
+        return sys.platform == "win32"
+
+    def register(self, hotkey_id: int, modifiers: int, virtual_key: int, callback) -> bool:
+        """Register a hotkey with the OS, returns False if unsupported or already taken"""
+        if not self.is_supported():
+            return False
+
+        if not ctypes.windll.user32.RegisterHotKey(None, hotkey_id, modifiers | MOD_NOREPEAT, virtual_key):
+            logger.warning(f"RegisterHotKey failed for hotkey id {hotkey_id}")
+            return False
+
+        self._callbacks[hotkey_id] = callback
+        return True
+
+    def unregister_all(self):
+        """Release every hotkey registered by this filter"""
+        for hotkey_id in self._callbacks:
+            ctypes.windll.user32.UnregisterHotKey(None, hotkey_id)
+        self._callbacks.clear()
+
+    def nativeEventFilter(self, event_type, message):
+        # Thread messages (hWnd = NULL) arrive as windows_dispatcher_MSG
+        if event_type in (b"windows_dispatcher_MSG", b"windows_generic_MSG"):
+            from ctypes import wintypes
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_HOTKEY:
+                callback = self._callbacks.get(msg.wParam)
+                if callback:
+                    callback()
+                    return True, 0
+        return False, 0
@@ -6,11 +6,69 @@ Handles notification sounds with settings integration
 import logging
 import json
 import os
-from PyQt5.QtMultimedia import QSound
-from PyQt5.QtCore import QStandardPaths
+import sys
+from functools import lru_cache
+from PyQt5.QtMultimedia import QSoundEffect
+from PyQt5.QtCore import QStandardPaths, QTimer, QCoreApplication, QUrl
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional, the stdlib json module produces the same file
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    _loads = json.loads
+
+# CUSTOM SOUND PATHS - Bạn có thể thay đổi đường dẫn tại đây
+_LOCAL_SOUND_PATHS = (
+    # Drip custom notification sounds (WAV format)
+    "assets/sound/DripSoud3.wav",       # File âm thanh chính của Drip
+    "assets/sound/DripSoud1.wav",       # File âm thanh dự phòng 1
+    "assets/sound/DripSoud2.wav",       # File âm thanh dự phòng 2
+    
+    # Backup custom sounds
+    "sounds/notification.wav",           # Đường dẫn tương đối
+    "sounds/bell.wav",                   # File chuông
+)
+
+# System sounds (fallback), only the current OS's paths are probed
+# QSoundEffect only decodes WAV, so ogg/aiff system sounds are not listed
+_PLATFORM_SOUND_PATHS = {
+    'linux': ("/usr/share/sounds/alsa/Side_Left.wav",),
+}
+
+_CANDIDATE_SOUND_PATHS = _LOCAL_SOUND_PATHS + _PLATFORM_SOUND_PATHS.get(sys.platform, ())
+
+# Rapid toggles within this window are written to disk once
+SAVE_DELAY_MS = 500
+
+# Written as created_at, the module file never changes while the app runs
+_MODULE_MTIME = str(os.path.getmtime(__file__)) if os.path.exists(__file__) else 'unknown'
+
+# Parsed settings file, reused until the file's mtime changes
+_SETTINGS_CACHE = {'path': None, 'mtime': None, 'data': None}
+
+# First existing candidate, probed once per process instead of on every SoundManager construction
+_RESOLVED_SOUND_PATH = next((path for path in _CANDIDATE_SOUND_PATHS if os.path.exists(path)), None)
+
+def _read_settings_file(path):
+    """Return the parsed settings file, parsing it again only if it changed on disk"""
+    mtime = os.stat(path).st_mtime_ns
+    if _SETTINGS_CACHE['path'] != path or _SETTINGS_CACHE['mtime'] != mtime:
+        with open(path, 'rb') as f:
+            data = _loads(f.read())
+        _SETTINGS_CACHE.update(path=path, mtime=mtime, data=data)
+    # Callers may modify the result, keep the cached copy intact
+    return dict(_SETTINGS_CACHE['data'])
+
 class SoundManager:
     """
     Manages notification sounds for the application
@@ -20,90 +78,109 @@ class SoundManager:
         self.settings_file = "data/drip_settings.json"
         self.sound_enabled = True
         self.notification_sound = None
+        self.sound_path = None
+        
+        # Debounced settings writes, flushed when the application quits
+        self.save_timer = QTimer()
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self.write_settings)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.cleanup)
         
         # Load settings
         self.load_settings()
         
-        # Initialize notification sound
-        self.init_notification_sound()
+        # Pick notification sound
+        self.resolve_sound_path()
+        
+        # Warm the audio backend once the event loop is idle, so the first notification is not delayed
+        if self.sound_enabled:
+            QTimer.singleShot(0, self.get_notification_sound)
     
-    def init_notification_sound(self):
-        """Initialize the notification sound"""
-        try:
-            # CUSTOM SOUND PATHS - Bạn có thể thay đổi đường dẫn tại đây
-            custom_sound_paths = [
-                # Drip custom notification sounds (WAV format)
-                "assets/sound/DripSoud3.wav",       # File âm thanh chính của Drip
-                "assets/sound/DripSoud1.wav",       # File âm thanh dự phòng 1
-                "assets/sound/DripSoud2.wav",       # File âm thanh dự phòng 2
-                
-                # Backup custom sounds
-                "sounds/notification.wav",           # Đường dẫn tương đối
-                "sounds/bell.wav",                   # File chuông
-                
-                # System sounds (fallback)
-                "/usr/share/sounds/alsa/Side_Left.wav",
-                "/usr/share/sounds/ubuntu/stereo/message-new-instant.ogg",
-                "/System/Library/Sounds/Glass.aiff",  # macOS
-            ]
-            
-            # Try custom sound files first
-            for sound_path in custom_sound_paths:
-                if os.path.exists(sound_path):
-                    try:
-                        # Use QSound for WAV and other audio formats
-                        self.notification_sound = QSound(sound_path)
-                        logger.info(f"Using notification sound: {sound_path}")
-                        return
-                    except Exception as e:
-                        logger.warning(f"Failed to load sound {sound_path}: {e}")
-                        continue
-            
-            # Fallback to system sounds
-            if os.name == 'nt':  # Windows
-                self.notification_sound = QSound("SystemAsterisk")
-                logger.info("Using Windows system sound")
-            else:  # Linux/macOS fallback
-                self.notification_sound = None
-                logger.info("Using system beep as notification sound")
-            
-        except Exception as e:
-            logger.error(f"Error initializing notification sound: {e}")
-            self.notification_sound = None
+    def resolve_sound_path(self):
+        """Choose the notification sound, the QSoundEffect itself is created on first play"""
+        if _RESOLVED_SOUND_PATH:
+            self.sound_path = _RESOLVED_SOUND_PATH
+            logger.info("Using notification sound: %s", self.sound_path)
+        else:
+            # QSoundEffect only plays files, on Windows play_system_beep uses the asterisk sound
+            self.sound_path = None
+            logger.info("Using system beep as notification sound")
+    
+    def get_notification_sound(self):
+        """Create the QSoundEffect on first use, so users with sound disabled never load the audio backend"""
+        if self.notification_sound is None and self.sound_path:
+            try:
+                # QSoundEffect decodes the WAV once and replays it from memory
+                self.notification_sound = QSoundEffect()
+                self.notification_sound.setSource(QUrl.fromLocalFile(os.path.abspath(self.sound_path)))
+                self.notification_sound.setVolume(1.0)
+            except Exception as e:
+                logger.warning("Failed to load sound %s: %s", self.sound_path, e)
+                self.sound_path = None
+        return self.notification_sound
     
     def load_settings(self):
         """Load sound settings from file"""
         try:
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    self.sound_enabled = settings.get('alert_sound_enabled', True)
-                    logger.info(f"Loaded sound settings: enabled={self.sound_enabled}")
+                settings = _read_settings_file(self.settings_file)
+                self.sound_enabled = settings.get('alert_sound_enabled', True)
+                logger.info("Loaded sound settings: enabled=%s", self.sound_enabled)
             else:
                 # Create default settings file
                 self.save_settings()
                 logger.info("Created default sound settings")
                 
         except Exception as e:
-            logger.error(f"Error loading sound settings: {e}")
+            logger.error("Error loading sound settings: %s", e)
             self.sound_enabled = True
     
     def save_settings(self):
-        """Save sound settings to file"""
+        """Schedule a settings write, saves requested within SAVE_DELAY_MS are coalesced"""
+        self.save_timer.start(SAVE_DELAY_MS)
+    
+    def flush_settings(self):
+        """Write a pending settings save immediately"""
+        if self.save_timer.isActive():
+            self.save_timer.stop()
+            self.write_settings()
+    
+    def cleanup(self):
+        """Flush pending settings and release the QSoundEffect before Qt tears down"""
+        self.flush_settings()
+        if self.notification_sound is not None:
+            self.notification_sound.stop()
+            self.notification_sound.deleteLater()
+            self.notification_sound = None
+    
+    def write_settings(self):
+        """Write sound settings to file atomically, keeping the other keys of the shared file"""
         try:
-            settings = {
+            settings = {}
+            if os.path.exists(self.settings_file):
+                try:
+                    settings = _read_settings_file(self.settings_file)
+                except ValueError:
+                    logger.warning("Settings file is corrupt, rewriting it")
+            
+            settings.update({
                 'alert_sound_enabled': self.sound_enabled,
                 'app_version': '1.0.0',
-                'created_at': str(os.path.getmtime(__file__) if os.path.exists(__file__) else 'unknown')
-            }
+                'created_at': _MODULE_MTIME
+            })
             
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            # Write to a temp file and swap it in, so a crash never leaves a half-written file
+            tmp_path = self.settings_file + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(settings))
+            os.replace(tmp_path, self.settings_file)
                 
-            logger.info(f"Saved sound settings: enabled={self.sound_enabled}")
+            logger.info("Saved sound settings: enabled=%s", self.sound_enabled)
             
         except Exception as e:
-            logger.error(f"Error saving sound settings: {e}")
+            logger.error("Error saving sound settings: %s", e)
     
     def play_notification(self):
         """Play notification sound if enabled"""
@@ -112,16 +189,16 @@ class SoundManager:
                 logger.debug("Sound disabled, skipping notification")
                 return
             
-            if self.notification_sound:
-                # Use QSound for WAV and other formats
-                self.notification_sound.play()
-                logger.debug("Played notification sound via QSound")
+            notification_sound = self.get_notification_sound()
+            if notification_sound:
+                notification_sound.play()
+                logger.debug("Played notification sound via QSoundEffect")
             else:
                 # Fallback to system beep
                 self.play_system_beep()
                 
         except Exception as e:
-            logger.error(f"Error playing notification sound: {e}")
+            logger.error("Error playing notification sound: %s", e)
             # Last resort: try system beep
             self.play_system_beep()
     
@@ -132,13 +209,14 @@ class SoundManager:
                 import winsound
                 winsound.MessageBeep(winsound.MB_ICONASTERISK)
             else:  # Linux/macOS
-                # Use system bell
-                os.system('echo -e "\a"')
+                # Ring the terminal bell directly instead of spawning a shell
+                sys.stderr.write('\a')
+                sys.stderr.flush()
             
             logger.debug("Played system beep notification")
             
         except Exception as e:
-            logger.error(f"Error playing system beep: {e}")
+            logger.error("Error playing system beep: %s", e)
     
     def toggle_sound(self):
         """Toggle sound on/off"""
@@ -146,18 +224,21 @@ class SoundManager:
         self.save_settings()
         
         status = "enabled" if self.sound_enabled else "disabled"
-        logger.info(f"Sound notification {status}")
+        logger.info("Sound notification %s", status)
         
         return self.sound_enabled
     
-    def set_sound_enabled(self, enabled: bool):
-        """Set sound enabled state"""
-        if self.sound_enabled != enabled:
-            self.sound_enabled = enabled
-            self.save_settings()
-            
-            status = "enabled" if enabled else "disabled"
-            logger.info(f"Sound notification {status}")
+    def set_sound_enabled(self, enabled: bool) -> bool:
+        """Set sound enabled state, returns True if the state changed"""
+        if self.sound_enabled == enabled:
+            return False
+        
+        self.sound_enabled = enabled
+        self.save_settings()
+        
+        status = "enabled" if enabled else "disabled"
+        logger.info("Sound notification %s", status)
+        return True
     
     def is_sound_enabled(self) -> bool:
         """Check if sound is enabled"""
@@ -173,17 +254,12 @@ class SoundManager:
             self.play_notification()
             logger.info("Test notification sound played")
         except Exception as e:
-            logger.error(f"Error testing notification sound: {e}")
+            logger.error("Error testing notification sound: %s", e)
         
         # Restore original state
         self.sound_enabled = original_state
 
-# Global sound manager instance
-_sound_manager_instance = None
-
+@lru_cache(maxsize=1)
 def get_sound_manager():
     """Get global sound manager instance"""
-    global _sound_manager_instance
-    if _sound_manager_instance is None:
-        _sound_manager_instance = SoundManager()
-    return _sound_manager_instance
\ No newline at end of file
+    return SoundManager()
\ No newline at end of file